@@ -0,0 +1,48 @@
+"""Shared helpers for the .scripts/bench_*.py benchmarks.
+
+The benchmarks time recall's own modules, which import talon, so they run inside
+Talon rather than from a plain shell. Open the Talon REPL (~/.talon/bin/repl)
+and run, for example:
+
+    import runpy; runpy.run_path("<path to recall>/.scripts/bench_formatters.py")
+"""
+
+import os
+import sys
+import time
+
+RECALL_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def find_module(relative_path: str):
+    """Return the loaded module for a file in this recall checkout, e.g.
+    "core/create_spoken_forms.py". Matching on the file path keeps a community
+    checkout with the same module layout from being picked up instead."""
+    path = os.path.normcase(os.path.join(RECALL_ROOT, relative_path))
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and os.path.normcase(os.path.abspath(module_file)) == path:
+            return module
+    raise RuntimeError(
+        f"{relative_path} isn't loaded; run this benchmark from the Talon REPL"
+    )
+
+
+def best_of(fn, repeat: int = 5, setup=None) -> float:
+    """Best wall time in seconds of repeat calls, running setup before each"""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, seconds: float, count: int = 0):
+    """Print one timing line, with the per-item cost when count is given"""
+    line = f"{label:<56} {seconds * 1000:10.2f} ms"
+    if count:
+        line += f"  ({seconds * 1e6 / count:8.2f} us each)"
+    print(line)
@@ -0,0 +1,133 @@
+"""Timing harness for the text formatters.
+
+Runs a fixed corpus of prose, identifiers, paths, numbers and non-ASCII text
+through every formatter in formatters_dict (format and unformat), through the
+helpers they are built from (CodeFormatter._format_delim,
+TitleFormatter._title_case_words, de_camel, remove_code_formatting) and through
+format_text_without_adding_to_history with composite formatter strings. de_camel
+is also timed against building its pattern per call, as it did before the
+regexes were precompiled.
+
+Usage (Talon REPL): see bench_common.py
+"""
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_common import best_of, find_module, report  # noqa: E402
+
+CORPUS = [
+    "hello world",
+    "the quick brown fox jumps over the lazy dog",
+    "a tale of two cities",
+    "state-of-the-art design for the web",
+    "  leading and trailing whitespace  ",
+    "version 10 release 2x faster",
+    "parse IP address from HTTP header",
+    "getHTTPResponseCode",
+    "XMLHttpRequest",
+    "user_id_from_session",
+    "kebab-case-identifier",
+    "dotted.module.path",
+    "src/components/app_switcher.py",
+    "std::vector::push_back",
+    "camelCase42AndMore",
+    "already Title Case Words",
+    "ALL CAPS SENTENCE HERE",
+    "hello, world. how are you?",
+    "it's a dog's life (really)",
+    "quote \"inside\" text",
+    "åsa älskar öl",
+    "snake_case_with_ÅÄÖ_letters",
+    "one two three four five six seven eight nine ten eleven twelve",
+    "function call with 3 args and 2 returns",
+]
+
+COMPOSITES = [
+    "SNAKE_CASE",
+    "PRIVATE_CAMEL_CASE",
+    "ALL_CAPS,SNAKE_CASE",
+    "DOUBLE_QUOTED_STRING,CAPITALIZE_ALL_WORDS",
+    "PUBLIC_CAMEL_CASE,REMOVE_FORMATTING",
+]
+
+PASSES = 20
+
+
+def per_call_de_camel(text: str) -> str:
+    """de_camel as it was, building the boundary pattern on every call"""
+    Ll = "a-zåäö"
+    Lu = "A-ZÅÄÖ"
+    L = f"{Ll}{Lu}"
+    low_to_upper = rf"(?<=[{Ll}])(?=[{Lu}])"
+    upper_to_last_upper = rf"(?<=[L{Lu}])(?=[{Lu}][{Ll}])"
+    letter_to_digit = rf"(?<=[{L}])(?=[\d])"
+    digit_to_letter = rf"(?<=[\d])(?=[{L}])"
+    return re.sub(
+        rf"{low_to_upper}|{upper_to_last_upper}|{letter_to_digit}|{digit_to_letter}",
+        " ",
+        text,
+    )
+
+
+def time_over_corpus(label: str, fn):
+    def run():
+        for _ in range(PASSES):
+            for text in CORPUS:
+                fn(text)
+
+    report(label, best_of(run), PASSES * len(CORPUS))
+
+
+def main():
+    formatters = find_module("core/formatters/formatters.py")
+    formatters_dict = formatters.formatters_dict
+
+    for text in CORPUS:
+        assert formatters.de_camel(text) == per_call_de_camel(text)
+
+    snake = formatters_dict["SNAKE_CASE"]
+    camel = formatters_dict["PRIVATE_CAMEL_CASE"]
+    title = formatters_dict["CAPITALIZE_ALL_WORDS"]
+
+    print(f"{len(CORPUS)} texts x {PASSES} passes")
+    print("-- helpers")
+    time_over_corpus(
+        "_format_delim (snake)",
+        lambda text: snake._format_delim(text, "_", formatters.lower, formatters.lower),
+    )
+    time_over_corpus(
+        "_format_delim (camel)",
+        lambda text: camel._format_delim(
+            text, "", formatters.lower, formatters.capitalize
+        ),
+    )
+    time_over_corpus(
+        "_title_case_words",
+        lambda text: title._title_case_words(
+            [x for x in formatters.WHITESPACE_SPLIT.split(text) if x]
+        ),
+    )
+    time_over_corpus("de_camel", formatters.de_camel)
+    time_over_corpus("de_camel, pattern built per call", per_call_de_camel)
+    time_over_corpus("remove_code_formatting", formatters.remove_code_formatting)
+
+    print("-- formatters (format / unformat)")
+    for formatter_id, formatter in formatters_dict.items():
+        time_over_corpus(f"{formatter_id}.format", formatter.format)
+        time_over_corpus(f"{formatter_id}.unformat", formatter.unformat)
+
+    print("-- format_text_without_adding_to_history")
+    for composite in COMPOSITES:
+        for unformat in (False, True):
+            time_over_corpus(
+                f"{composite}{' (unformat)' if unformat else ''}",
+                lambda text: formatters.format_text_without_adding_to_history(
+                    text, composite, unformat
+                ),
+            )
+
+
+main()
@@ -0,0 +1,85 @@
+"""Benchmark the launchable-app scan over a synthetic tree of .desktop entries.
+
+Writes 2,000 .desktop files to a temporary directory (a quarter with a relative
+Exec that needs a `which` lookup, a few hidden with NoDisplay) and times
+scan_application_directories with files parsed serially, through pool_map, and
+from the per-directory mtime cache. The serial and pooled maps must be identical,
+including their order. Linux only, since .desktop parsing is Linux only.
+
+Usage (Talon REPL): see bench_common.py
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_common import best_of, find_module, report  # noqa: E402
+
+ENTRY_COUNT = 2000
+
+
+def write_desktop_entries(base: str, count: int):
+    for i in range(count):
+        if i % 4 == 0:
+            exec_key = "sh -c true %U"
+        else:
+            exec_key = f"/opt/bench/app{i}/bin/app{i} %F"
+        lines = [
+            "[Desktop Entry]",
+            "Type=Application",
+            f"Name=Bench App {i}",
+            f"Exec={exec_key}",
+        ]
+        if i % 50 == 0:
+            lines.append("NoDisplay=true")
+        with open(os.path.join(base, f"bench-app-{i}.desktop"), "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def main():
+    app_switcher = find_module("core/app_switcher/app_switcher.py")
+    if not hasattr(app_switcher, "parse_desktop_file"):
+        print("bench_launch_scan: .desktop entries are only scanned on Linux")
+        return
+
+    cache = app_switcher.launch_directory_cache
+    saved_cache = dict(cache)
+    pool_map = app_switcher.pool_map
+    with tempfile.TemporaryDirectory() as base:
+        write_desktop_entries(base, ENTRY_COUNT)
+
+        def scan():
+            return app_switcher.scan_application_directories([base])
+
+        def forget():
+            cache.pop(base, None)
+
+        try:
+            app_switcher.pool_map = lambda fn, items: list(map(fn, items))
+            forget()
+            serial = scan()
+            serial_time = best_of(scan, repeat=3, setup=forget)
+            app_switcher.pool_map = pool_map
+            forget()
+            pooled = scan()
+            pooled_time = best_of(scan, repeat=3, setup=forget)
+            assert list(serial.items()) == list(pooled.items()), (
+                "pooled scan disagrees with serial scan"
+            )
+            cached_time = best_of(scan)
+        finally:
+            app_switcher.pool_map = pool_map
+            cache.clear()
+            cache.update(saved_cache)
+
+    print(
+        f"{ENTRY_COUNT} entries, {len(pooled)} launchable, "
+        f"{app_switcher.launch_scan_max_workers} workers"
+    )
+    report("serial parse", serial_time, ENTRY_COUNT)
+    report("pool_map parse", pooled_time, ENTRY_COUNT)
+    report("mtime cache hit", cached_time, ENTRY_COUNT)
+
+
+main()
@@ -0,0 +1,130 @@
+"""Benchmark PhraseReplacer on a 10k-entry table and a long dictation.
+
+Generates 10,000 spoken forms of one to four words over a small vocabulary, so
+first words are shared and phrases overlap, plus 50,000 words of dictation that
+mixes phrases with filler. Times a full update, an incremental update of one
+entry and replace, against the previous index of phrases by first word and
+length, and checks both give the same output here and on randomised trials.
+
+Usage (Talon REPL): see bench_common.py
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_common import best_of, find_module, report  # noqa: E402
+
+ENTRY_COUNT = 10_000
+DICTATION_WORDS = 50_000
+TRIALS = 200
+
+
+class IndexedPhraseReplacer:
+    """The previous PhraseReplacer: phrases indexed by first word, then by the
+    number of following words, longest first"""
+
+    def __init__(self):
+        self.phrase_index = {}
+
+    def update(self, phrase_dict: dict[str, str]):
+        phrase_index = {}
+        for spoken_form, written_form in phrase_dict.items():
+            words = spoken_form.split()
+            if not words:
+                continue
+            first_word, n_next = words[0], len(words) - 1
+            phrase_index.setdefault(first_word, {}).setdefault(n_next, {})[
+                tuple(words[1:])
+            ] = written_form
+        self.phrase_index = {
+            first_word: sorted(same_first_word.items(), key=lambda x: -x[0])
+            for first_word, same_first_word in phrase_index.items()
+        }
+
+    def replace(self, input_words):
+        input_words = tuple(input_words)
+        output_words = []
+        first_word_i = 0
+        while first_word_i < len(input_words):
+            first_word = input_words[first_word_i]
+            next_word_i = first_word_i + 1
+            for n_next, phrases_n_next in self.phrase_index.get(first_word, []):
+                continuation = input_words[next_word_i : next_word_i + n_next]
+                if continuation in phrases_n_next:
+                    output_words.append(phrases_n_next[continuation])
+                    first_word_i += 1 + n_next
+                    break
+            else:
+                output_words.append(first_word)
+                first_word_i += 1
+        return output_words
+
+
+def synthetic_table(rng: random.Random, count: int, vocabulary: list[str]):
+    table = {}
+    while len(table) < count:
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(1, 4))]
+        table[" ".join(words)] = "_".join(words).upper()
+    return table
+
+
+def synthetic_dictation(rng: random.Random, count: int, table, vocabulary):
+    spoken_forms = list(table)
+    fillers = ["the", "and", "then", "please", "okay", "so"]
+    words = []
+    while len(words) < count:
+        roll = rng.random()
+        if roll < 0.3:
+            words.extend(rng.choice(spoken_forms).split())
+        elif roll < 0.7:
+            words.append(rng.choice(vocabulary))
+        else:
+            words.append(rng.choice(fillers))
+    return words[:count]
+
+
+def main():
+    PhraseReplacer = find_module("core/vocabulary/vocabulary.py").PhraseReplacer
+    rng = random.Random(0)
+    words = [f"w{i}" for i in range(1500)]
+    table = synthetic_table(rng, ENTRY_COUNT, words)
+    dictation = synthetic_dictation(rng, DICTATION_WORDS, table, words)
+
+    trie = PhraseReplacer()
+    trie.update(table)
+    indexed = IndexedPhraseReplacer()
+    indexed.update(table)
+    assert trie.replace(dictation) == indexed.replace(dictation)
+    for _ in range(TRIALS):
+        trial_words = rng.sample(words, 8)
+        trial_table = synthetic_table(rng, 30, trial_words)
+        trial = synthetic_dictation(rng, 60, trial_table, trial_words)
+        trial_trie = PhraseReplacer()
+        trial_trie.update(trial_table)
+        trial_indexed = IndexedPhraseReplacer()
+        trial_indexed.update(trial_table)
+        assert trial_trie.replace(trial) == trial_indexed.replace(trial)
+
+    # One entry edited, as when a line of the vocabulary csv changes
+    edited = dict(table)
+    edited[next(iter(edited))] = "EDITED"
+
+    def incremental_update():
+        trie.update(edited)
+        trie.update(table)
+
+    print(f"{len(table)} entries, {len(dictation)} words of dictation")
+    report("full update, trie", best_of(lambda: PhraseReplacer().update(table)))
+    report(
+        "full update, index", best_of(lambda: IndexedPhraseReplacer().update(table))
+    )
+    report("one-entry update x2, trie", best_of(incremental_update))
+    report("replace, trie", best_of(lambda: trie.replace(dictation)), len(dictation))
+    report(
+        "replace, index", best_of(lambda: indexed.replace(dictation)), len(dictation)
+    )
+
+
+main()
@@ -0,0 +1,101 @@
+"""Benchmark build_spoken_form_map against the per-item action path it replaced.
+
+Builds 500 synthetic app and window names (mixed case, digits, file extensions,
+symbols) and times the batch builder cold and warm against the previous
+implementation: one actions.user.create_spoken_forms dispatch per name and a
+shortest-name pass over every candidate. Both must produce the same map.
+
+Usage (Talon REPL): see bench_common.py
+"""
+
+import os
+import random
+import sys
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_common import best_of, find_module, report  # noqa: E402
+
+from talon import actions, cron  # noqa: E402
+
+NAME_COUNT = 500
+
+WORDS = [
+    "visual", "studio", "code", "terminal", "notes", "mail", "calendar",
+    "firefox", "chrome", "slack", "discord", "spotify", "finder", "preview",
+    "iTerm2", "docker", "desktop", "photoshop", "zoom", "teams", "obsidian",
+    "server", "backend", "frontend", "review", "draft", "report", "budget",
+]
+EXTENSIONS = ["", "", "", ".py", ".md", ".json", ".txt", ".tsx"]
+SEPARATORS = [" ", " ", "-", "_", " - ", " — "]
+
+
+def synthetic_names(count: int, seed: int = 0) -> dict[str, str]:
+    rng = random.Random(seed)
+    names = {}
+    while len(names) < count:
+        words = rng.sample(WORDS, rng.randint(1, 4))
+        if rng.random() < 0.3:
+            words.append(str(rng.randint(1, 2030)))
+        if rng.random() < 0.3:
+            words[0] = words[0].capitalize()
+        name = rng.choice(SEPARATORS).join(words) + rng.choice(EXTENSIONS)
+        names[name] = name
+    return names
+
+
+def per_item_map(sources):
+    """The previous create_spoken_forms_from_map body, with default arguments"""
+    all_spoken_forms = defaultdict(list)
+    for name, value in sources.items():
+        spoken_forms = actions.user.create_spoken_forms(name)
+        for spoken_form in spoken_forms:
+            all_spoken_forms[spoken_form].append((name, value))
+    return {
+        spoken_form: min(items, key=lambda item: len(item[0]))[1]
+        for spoken_form, items in all_spoken_forms.items()
+    }
+
+
+def main():
+    create_spoken_forms = find_module("core/create_spoken_forms.py")
+    sources = synthetic_names(NAME_COUNT)
+    clear = create_spoken_forms.cached_spoken_forms.cache_clear
+
+    # The disk cache would turn the cold runs into lookups, and the synthetic
+    # names shouldn't be persisted; set the cache state aside and restore it
+    disk_entries = dict(create_spoken_forms._disk_entries)
+    used_entries = dict(create_spoken_forms._used_entries)
+    write_pending = create_spoken_forms._write_job is not None
+    create_spoken_forms._disk_entries.clear()
+    try:
+        expected = per_item_map(sources)
+        actual = create_spoken_forms.build_spoken_form_map(sources)
+        assert actual == expected, "build_spoken_form_map disagrees with per-item map"
+
+        print(f"{len(sources)} names, {len(actual)} spoken forms")
+        runs = [
+            ("per-item actions", lambda: per_item_map(sources)),
+            (
+                "build_spoken_form_map",
+                lambda: create_spoken_forms.build_spoken_form_map(sources),
+            ),
+        ]
+        for label, run in runs:
+            report(f"{label}, cold", best_of(run, setup=clear), len(sources))
+        for label, run in runs:
+            report(f"{label}, warm", best_of(run), len(sources))
+    finally:
+        clear()
+        if create_spoken_forms._write_job:
+            cron.cancel(create_spoken_forms._write_job)
+            create_spoken_forms._write_job = None
+        create_spoken_forms._disk_entries.clear()
+        create_spoken_forms._disk_entries.update(disk_entries)
+        create_spoken_forms._used_entries.clear()
+        create_spoken_forms._used_entries.update(used_entries)
+        if write_pending:
+            create_spoken_forms.schedule_spoken_forms_cache_write()
+
+
+main()
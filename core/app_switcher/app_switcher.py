@@ -1,11 +1,15 @@
+import bisect
+import json
 import os
 import shlex
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import talon
-from talon import Context, Module, actions, app, fs, imgui, ui
+from talon import Context, Module, actions, app, cron, fs, imgui, ui
 
 # Construct a list of spoken form overrides for application names (similar to how homophone list is managed)
 # These overrides are used *instead* of the generated spoken forms for the given app name or .exe (on Windows)
@@ -34,6 +38,47 @@ excludes = set()
 # a list of the currently running application names
 running_application_dict = {}
 
+# running App objects by name (and lower-cased exe on Windows), rebuilt with
+# running_application_dict so get_running_app doesn't scan ui.apps()
+running_app_index = {}
+
+# sorted (lower-cased spoken form, app name) pairs from self.running, for
+# bisecting the fuzzy prefix match in get_running_app
+running_prefix_index = []
+
+# the map last assigned to self.running; reassigning recompiles the grammar
+published_running_list = None
+
+# app_launch/app_close arrive in bursts (e.g. opening a batch of terminals),
+# so the running list is rebuilt once they settle
+running_list_debounce = "300ms"
+running_list_job = None
+
+# Launchable apps are scanned per directory and cached by directory mtime, so a
+# restart only rescans directories whose contents changed. Note a directory's
+# mtime changes when entries are added, removed or renamed, not when a file in
+# it is edited in place.
+launch_cache_path = os.path.join(
+    overrides_directory, f"launch_cache.{talon.app.platform}.json"
+)
+# {directory: {"mtime": float, "items": {name: path}, "subdirs": [path]}}
+launch_directory_cache = {}
+launch_scan_thread = None
+# Upper bound on threads used to parse .desktop files / enumerate bundle dirs
+launch_scan_max_workers = min(8, (os.cpu_count() or 1) + 4)
+
+
+def pool_map(fn, items: list) -> list:
+    """map() over a bounded thread pool. Results keep the order of items, so
+    merging them doesn't depend on thread timing."""
+    if len(items) <= 1:
+        return list(map(fn, items))
+    with ThreadPoolExecutor(
+        max_workers=min(launch_scan_max_workers, len(items)),
+        thread_name_prefix="launch_scan",
+    ) as executor:
+        return list(executor.map(fn, items))
+
 
 words_to_exclude = [
     "zero",
@@ -170,53 +215,69 @@ elif app.platform == "linux":
             linux_application_directories.append(f"{directory}/applications")
     linux_application_directories = list(set(linux_application_directories))
 
-    def get_apps():
-        # app shortcuts in program menu are contained in .desktop files. This function parses those files for the app name and command
+    # find field codes in exec key with regex
+    # https://specifications.freedesktop.org/desktop-entry-spec/desktop-entry-spec-latest.html#exec-variables
+    args_pattern = re.compile(r"\%[UufFcik]")
+
+    def parse_desktop_file(path: str) -> tuple[str, str] | None:
+        """Returns (name, command) for a .desktop file, or None if it is hidden"""
+        config = configparser.ConfigParser(interpolation=None)
+        config.read(path)
+        # only parse shortcuts that are not hidden
+        if config.has_option("Desktop Entry", "NoDisplay"):
+            return None
+        name_key = config["Desktop Entry"]["Name"]
+        exec_key = config["Desktop Entry"]["Exec"]
+        # remove extra quotes from exec
+        if exec_key[0] == '"' and exec_key[-1] == '"':
+            exec_key = re.sub('"', "", exec_key)
+        # remove field codes and add full path if necessary
+        if exec_key[0] == "/":
+            return name_key, re.sub(args_pattern, "", exec_key)
+        exec_path = (
+            subprocess.check_output(
+                ["which", exec_key.split()[0]],
+                stderr=subprocess.DEVNULL,
+            )
+            .decode("utf-8")
+            .strip()
+        )
+        return name_key, (
+            exec_path
+            + " "
+            + re.sub(
+                args_pattern,
+                "",
+                " ".join(exec_key.split()[1:]),
+            )
+        )
+
+    def try_parse_desktop_file(path: str) -> tuple[str, str] | None:
+        try:
+            return parse_desktop_file(path)
+        except Exception:
+            print(
+                "linux get_apps(): skipped parsing application file ",
+                os.path.basename(path),
+            )
+            return None
+
+    def scan_application_directory(base: str) -> tuple[dict[str, str], list[str]]:
+        # app shortcuts in program menu are contained in .desktop files
+        paths = sorted(
+            entry.path for entry in os.scandir(base) if entry.name.endswith(".desktop")
+        )
         items = {}
-        # find field codes in exec key with regex
-        # https://specifications.freedesktop.org/desktop-entry-spec/desktop-entry-spec-latest.html#exec-variables
-        args_pattern = re.compile(r"\%[UufFcik]")
-        for base in linux_application_directories:
-            if os.path.isdir(base):
-                for entry in os.scandir(base):
-                    if entry.name.endswith(".desktop"):
-                        try:
-                            config = configparser.ConfigParser(interpolation=None)
-                            config.read(entry.path)
-                            # only parse shortcuts that are not hidden
-                            if not config.has_option("Desktop Entry", "NoDisplay"):
-                                name_key = config["Desktop Entry"]["Name"]
-                                exec_key = config["Desktop Entry"]["Exec"]
-                                # remove extra quotes from exec
-                                if exec_key[0] == '"' and exec_key[-1] == '"':
-                                    exec_key = re.sub('"', "", exec_key)
-                                # remove field codes and add full path if necessary
-                                if exec_key[0] == "/":
-                                    items[name_key] = re.sub(args_pattern, "", exec_key)
-                                else:
-                                    exec_path = (
-                                        subprocess.check_output(
-                                            ["which", exec_key.split()[0]],
-                                            stderr=subprocess.DEVNULL,
-                                        )
-                                        .decode("utf-8")
-                                        .strip()
-                                    )
-                                    items[name_key] = (
-                                        exec_path
-                                        + " "
-                                        + re.sub(
-                                            args_pattern,
-                                            "",
-                                            " ".join(exec_key.split()[1:]),
-                                        )
-                                    )
-                        except Exception:
-                            print(
-                                "linux get_apps(): skipped parsing application file ",
-                                entry.name,
-                            )
-        return items
+        for parsed in pool_map(try_parse_desktop_file, paths):
+            if parsed:
+                items[parsed[0]] = parsed[1]
+        return items, []
+
+    # files within a directory are already parsed in parallel
+    directory_map = map
+
+    def get_apps():
+        return scan_application_directories(linux_application_directories)
 
 elif app.platform == "mac":
     mac_application_directories = [
@@ -226,24 +287,81 @@ elif app.platform == "mac":
         f"{Path.home()}/.nix-profile/Applications",
     ]
 
-    def get_apps(paths: list[str] = mac_application_directories):
+    def scan_application_directory(base: str) -> tuple[dict[str, str], list[str]]:
         items = {}
         subdirs = []
-        for base in paths:
-            if not os.path.isdir(base):
+        for entry in sorted(os.scandir(base), key=lambda entry: entry.name):
+            if (not entry.is_dir()) or entry.name.startswith("."):
+                continue
+            if entry.name.endswith(".app"):
+                name = entry.name[:-4].lower()
+                items[name] = entry.path
+            else:
+                subdirs.append(entry.path)
+        return items, subdirs
+
+    def get_apps(paths: list[str] = mac_application_directories):
+        return scan_application_directories(paths)
+
+    # each directory is a cheap scandir, so enumerate them in parallel
+    directory_map = pool_map
+
+
+def scan_application_directories(paths: list[str]) -> dict[str, str]:
+    """Scan application directories (and any subdirectories they report),
+    reusing launch_directory_cache for directories whose mtime is unchanged"""
+    items = {}
+    visited = set()
+    pending = list(paths)
+    while pending:
+        level = []
+        stale = {}
+        for base in pending:
+            if base in visited or not os.path.isdir(base):
                 continue
-            for entry in os.scandir(base):
-                if (not entry.is_dir()) or entry.name.startswith("."):
-                    continue
-                if entry.name.endswith(".app"):
-                    name = entry.name[:-4].lower()
-                    items[name] = entry.path
-                else:
-                    subdirs.append(entry.path)
-        if len(subdirs):
-            items.update(get_apps(subdirs))
+            visited.add(base)
+            level.append(base)
+            mtime = os.stat(base).st_mtime
+            cached = launch_directory_cache.get(base)
+            if cached is None or cached["mtime"] != mtime:
+                stale[base] = mtime
+        for base, (dir_items, dir_subdirs) in zip(
+            stale, directory_map(scan_application_directory, list(stale))
+        ):
+            launch_directory_cache[base] = {
+                "mtime": stale[base],
+                "items": dir_items,
+                "subdirs": dir_subdirs,
+            }
+        # merge in the original directory order
+        subdirs = []
+        for base in level:
+            items.update(launch_directory_cache[base]["items"])
+            subdirs.extend(launch_directory_cache[base]["subdirs"])
+        pending = subdirs
+    # forget directories that no longer exist or are no longer reachable
+    for base in list(launch_directory_cache):
+        if base not in visited:
+            del launch_directory_cache[base]
+    return items
+
+
+def load_launch_cache():
+    try:
+        with open(launch_cache_path) as f:
+            launch_directory_cache.update(json.load(f))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error loading launch cache: {e}")
 
-        return items
+
+def save_launch_cache():
+    try:
+        with open(launch_cache_path, "w") as f:
+            json.dump(launch_directory_cache, f)
+    except Exception as e:
+        print(f"Error saving launch cache: {e}")
 
 
 @mod.capture(rule="{self.running}")  # | <user.text>)")
@@ -262,24 +380,30 @@ def launch_applications(m) -> str:
 
 
 def update_running_list():
-    global running_application_dict
+    global running_application_dict, published_running_list, running_list_job
+    global running_app_index, running_prefix_index
+    running_list_job = None
     running_application_dict = {}
-    running = {}
+    running_app_index = {}
     foreground_apps = ui.apps(background=False)
 
     for cur_app in foreground_apps:
         running_application_dict[cur_app.name.lower()] = cur_app.name
+        running_app_index.setdefault(cur_app.name, cur_app)
 
         if app.platform == "windows":
             exe = os.path.basename(cur_app.exe)
             running_application_dict[exe.lower()] = exe
+            running_app_index.setdefault(exe.lower(), cur_app)
 
     override_apps = excludes.union(overrides.values())
 
+    # spoken forms are memoized per name, so only newly launched apps cost
+    # anything to generate
     running = actions.user.create_spoken_forms_from_list(
         [
             curr_app.name
-            for curr_app in ui.apps(background=False)
+            for curr_app in foreground_apps
             if curr_app.name.lower() not in override_apps
             and curr_app.exe.lower() not in override_apps
             and os.path.basename(curr_app.exe).lower() not in override_apps
@@ -292,7 +416,20 @@ def update_running_list():
         if running_app_name := running_application_dict.get(full_application_name):
             running[running_name] = running_app_name
 
-    ctx.lists["self.running"] = running
+    if running != published_running_list:
+        ctx.lists["self.running"] = running
+        published_running_list = running
+        running_prefix_index = sorted(
+            (running_name.lower(), full_application_name)
+            for running_name, full_application_name in running.items()
+        )
+
+
+def schedule_running_list_update():
+    global running_list_job
+    if running_list_job:
+        cron.cancel(running_list_job)
+    running_list_job = cron.after(running_list_debounce, update_running_list)
 
 
 def update_overrides(name, flags):
@@ -327,14 +464,16 @@ class Actions:
                 raise RuntimeError(
                     f'Skipped getting app: "{name}" has less than 3 chars.'
                 )
-            for running_name, full_application_name in ctx.lists[
-                "self.running"
-            ].items():
-                if running_name == name or running_name.lower().startswith(
-                    name.lower()
-                ):
+            prefix = name.lower()
+            i = bisect.bisect_left(running_prefix_index, (prefix,))
+            if i < len(running_prefix_index):
+                running_name, full_application_name = running_prefix_index[i]
+                if running_name.startswith(prefix):
                     name = full_application_name
-                    break
+        application = running_app_index.get(name)
+        if application is not None:
+            return application
+        # not indexed yet, e.g. launched since the last (debounced) rebuild
         for application in ui.apps(background=False):
             if application.name == name or (
                 app.platform == "windows"
@@ -433,17 +572,50 @@ def gui_running(gui: imgui.GUI):
         actions.user.switcher_hide_running()
 
 
-def update_launch_list():
-    launch = get_apps()
-
+def publish_launch_list(launch):
     ctx.lists["self.launch"] = actions.user.create_spoken_forms_from_map(
         launch, words_to_exclude
     )
 
 
+def scan_launch_list():
+    """Background thread: scan application directories, then publish the list
+    back on the main thread"""
+    global launch_scan_thread
+    try:
+        launch = get_apps()
+        save_launch_cache()
+    except Exception as e:
+        print(f"Error scanning launchable applications: {e}")
+        return
+    finally:
+        launch_scan_thread = None
+    cron.after("0ms", lambda: publish_launch_list(launch))
+
+
+def update_launch_list():
+    global launch_scan_thread
+    if app.platform == "windows":
+        # shell:AppsFolder goes through COM, which stays on the main thread
+        publish_launch_list(get_apps())
+        return
+    if launch_scan_thread is not None:
+        return
+    if not launch_directory_cache:
+        load_launch_cache()
+    launch_scan_thread = threading.Thread(target=scan_launch_list, daemon=True)
+    launch_scan_thread.start()
+
+
 def ui_event(event, arg):
+    if event == "app_close":
+        # Drop the closed app right away, so get_running_app can't hand it out
+        # before the debounced rebuild
+        closed = [key for key, indexed in running_app_index.items() if indexed == arg]
+        for key in closed:
+            del running_app_index[key]
     if event in ("app_launch", "app_close"):
-        update_running_list()
+        schedule_running_list_update()
 
 
 # Talon starts faster if you don't use the `talon.ui` module during launch
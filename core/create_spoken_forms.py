@@ -1,10 +1,13 @@
+import hashlib
 import itertools
+import json
 import re
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, List, Mapping, Optional
 
-from talon import Module, actions
+from talon import Module, actions, app, cron
 
 from .keys.symbols import symbols_for_create_spoken_forms
 from .numbers.numbers import digits_map, scales, teens, tens
@@ -14,12 +17,24 @@ mod = Module()
 
 DEFAULT_MINIMUM_TERM_LENGTH = 2
 EXPLODE_MAX_LEN = 3
+# Bounded memo for create_spoken_forms; sources repeat every time the running,
+# launch and saved-window lists are rebuilt
+SPOKEN_FORMS_CACHE_SIZE = 4096
+# On-disk copy of generated spoken forms so startup list building is a dict
+# load. Bump SPOKEN_FORMS_CACHE_FORMAT when the generation code changes output.
+SPOKEN_FORMS_CACHE_FILE = Path(__file__).parent / "spoken_forms_cache.json"
+SPOKEN_FORMS_CACHE_FORMAT = 1
+SPOKEN_FORMS_CACHE_WRITE_DELAY = "5s"
 FANCY_REGULAR_EXPRESSION = r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|[0-9]+"
 SYMBOLS_REGEX = "|".join(
     re.escape(symbol) for symbol in set(symbols_for_create_spoken_forms.values())
 )
+# Sources with no symbol in them (nearly every window and app name) get the
+# same result from both regex passes, so the symbol pass is skipped for them
+SYMBOLS_PATTERN = re.compile(SYMBOLS_REGEX)
 FILE_EXTENSIONS_REGEX = r"^\b$"
 file_extensions = {}
+abbreviations_list = {}
 
 
 def update_regex():
@@ -41,6 +56,157 @@ def update_regex():
 update_regex()
 
 
+# ── Persisted cache ───────────────────────────────────────────────
+# Entries are keyed by a hash of the source and parameters; the file as a whole
+# is tagged with the version of the extension/abbreviation tables it was built
+# from and discarded on mismatch.
+_disk_entries: dict[str, list[str]] = {}
+_disk_loaded = False
+# Entries looked up or generated this session, least recently used first and
+# capped like the memo; written back first, then topped up with loaded entries
+# not yet seen this session, up to the cache size
+_used_entries: OrderedDict[str, list[str]] = OrderedDict()
+_write_job = None
+
+
+def tables_version() -> str:
+    """Hash of everything besides the source that feeds spoken-form generation"""
+    tables = [
+        SPOKEN_FORMS_CACHE_FORMAT,
+        sorted(file_extensions.items()),
+        sorted(abbreviations_list.items()),
+    ]
+    return hashlib.sha1(json.dumps(tables).encode()).hexdigest()
+
+
+def spoken_forms_cache_key(*params) -> str:
+    return hashlib.sha1(json.dumps(params).encode()).hexdigest()
+
+
+def load_spoken_forms_cache():
+    """Load persisted spoken forms, once, if they match the current tables"""
+    global _disk_loaded
+    if _disk_loaded:
+        return
+    _disk_loaded = True
+    try:
+        with open(SPOKEN_FORMS_CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        print(f"Error loading spoken forms cache: {e}")
+        return
+    if data.get("version") == tables_version():
+        _disk_entries.update(data.get("entries", {}))
+
+
+def write_spoken_forms_cache():
+    global _write_job
+    _write_job = None
+    # Keep loaded entries that haven't been looked up yet, or a write early in
+    # the session would drop every source that is only read after it
+    entries = dict(_used_entries)
+    for key, spoken_forms in _disk_entries.items():
+        if len(entries) >= SPOKEN_FORMS_CACHE_SIZE:
+            break
+        entries.setdefault(key, spoken_forms)
+    try:
+        with open(SPOKEN_FORMS_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"version": tables_version(), "entries": entries}, f)
+    except Exception as e:
+        print(f"Error writing spoken forms cache: {e}")
+
+
+def remember_spoken_forms(key: str, spoken_forms: list[str]):
+    _used_entries[key] = spoken_forms
+    _used_entries.move_to_end(key)
+    while len(_used_entries) > SPOKEN_FORMS_CACHE_SIZE:
+        _used_entries.popitem(last=False)
+
+
+def schedule_spoken_forms_cache_write():
+    global _write_job
+    if _write_job:
+        cron.cancel(_write_job)
+    _write_job = cron.after(SPOKEN_FORMS_CACHE_WRITE_DELAY, write_spoken_forms_cache)
+
+
+def reset_spoken_forms_cache():
+    """Drop memoized and loaded forms after the tables they depend on change.
+    The file is reloaded on next use in case it was built from the new tables."""
+    global _disk_loaded
+    cached_spoken_forms.cache_clear()
+    _disk_entries.clear()
+    _used_entries.clear()
+    _disk_loaded = False
+
+
+@lru_cache(maxsize=SPOKEN_FORMS_CACHE_SIZE)
+def cached_spoken_forms(
+    source: str,
+    words_to_exclude: tuple[str, ...],
+    minimum_term_length: int,
+    generate_subsequences: bool,
+) -> tuple[str, ...]:
+    """Memoized create_spoken_forms, backed by the on-disk cache. Defined ahead
+    of the csv trackers below, which reset it whenever the file extension or
+    abbreviation tables change, since both feed the transforms."""
+    load_spoken_forms_cache()
+    key = spoken_forms_cache_key(
+        source, words_to_exclude, minimum_term_length, generate_subsequences
+    )
+    spoken_forms = _disk_entries.get(key)
+    if spoken_forms is None:
+        spoken_forms = list(
+            generate_spoken_forms(
+                source, words_to_exclude, minimum_term_length, generate_subsequences
+            )
+        )
+        remember_spoken_forms(key, spoken_forms)
+        # Only new entries trigger a write
+        schedule_spoken_forms_cache_write()
+    else:
+        remember_spoken_forms(key, spoken_forms)
+    return tuple(spoken_forms)
+
+
+def generate_spoken_forms(
+    source: str,
+    words_to_exclude: tuple[str, ...],
+    minimum_term_length: int,
+    generate_subsequences: bool,
+) -> tuple[str, ...]:
+    spoken_forms_without_symbols = create_spoken_forms_from_regex(
+        source, REGEX_NO_SYMBOLS
+    )
+
+    if source_has_symbols(source):
+        spoken_forms_with_symbols = create_spoken_forms_from_regex(
+            source, REGEX_WITH_SYMBOLS
+        )
+    else:
+        spoken_forms_with_symbols = spoken_forms_without_symbols
+
+    # some may be identical, so ensure the list is reduced
+    spoken_forms = set(spoken_forms_with_symbols + spoken_forms_without_symbols)
+
+    # only generate the subsequences if requested
+    if generate_subsequences:
+        # todo: do we care about the subsequences that are excluded.
+        # the only one that seems relevant are the full spoken form for
+        spoken_forms.update(
+            generate_string_subsequences(
+                spoken_forms_without_symbols[-1],
+                words_to_exclude,
+                minimum_term_length,
+            )
+        )
+
+    # Avoid empty spoken forms.
+    return tuple(x for x in spoken_forms if x)
+
+
 @track_csv_list("file_extensions.csv", headers=("File extension", "Name"))
 def on_extensions(values):
     global FILE_EXTENSIONS_REGEX
@@ -50,15 +216,14 @@ def on_extensions(values):
         re.escape(file_extension.strip()) + "$" for file_extension in values.values()
     )
     update_regex()
-
-
-abbreviations_list = {}
+    reset_spoken_forms_cache()
 
 
 @track_csv_list("abbreviations.csv", headers=("Abbreviation", "Spoken Form"))
 def on_abbreviations(values):
     global abbreviations_list
     abbreviations_list = values
+    reset_spoken_forms_cache()
 
 
 REVERSE_PRONUNCIATION_MAP = {
@@ -420,6 +585,23 @@ def create_spoken_forms_from_regex(source: str, pattern: re.Pattern):
     return list(dict.fromkeys(spoken_forms))
 
 
+def source_has_symbols(source: str) -> bool:
+    """Whether REGEX_WITH_SYMBOLS could match anything REGEX_NO_SYMBOLS doesn't"""
+    return SYMBOLS_PATTERN.search(source.replace("'", "")) is not None
+
+
+# The symbol pass must be a no-op for symbol-free sources
+for _source in ["Visual Studio Code", "README", "iTerm2", "Tom's 2020 notes"]:
+    assert set(create_spoken_forms_from_regex(_source, REGEX_NO_SYMBOLS)) == set(
+        create_spoken_forms_from_regex(_source, REGEX_WITH_SYMBOLS)
+    )
+assert not source_has_symbols("Visual Studio Code")
+assert not source_has_symbols("Tom's notes")
+assert source_has_symbols("notepad++")
+assert source_has_symbols("Movies & TV")
+assert source_has_symbols("README.md")
+
+
 def generate_string_subsequences(
     source: str,
     words_to_exclude: list[str],
@@ -453,10 +635,34 @@ def generate_string_subsequences(
     ]
 
 
-@dataclass
-class SpeakableItem:
-    name: str
-    value: Any
+def build_spoken_form_map(
+    sources: Mapping[str, Any],
+    words_to_exclude: Optional[list[str]] = None,
+    minimum_term_length: int = DEFAULT_MINIMUM_TERM_LENGTH,
+    generate_subsequences: bool = True,
+) -> dict[str, Any]:
+    """
+    Batch version of create_spoken_forms_from_map: one pure-Python pass over the
+    whole map, without going through the action dispatcher per name.
+
+    Conflicts go to the shortest source name; on a tie the first source in the
+    map wins.
+    """
+    words_to_exclude = tuple(words_to_exclude or ())
+    shortest: dict[str, int] = {}
+    final_spoken_forms: dict[str, Any] = {}
+
+    for name, value in sources.items():
+        name_length = len(name)
+        for spoken_form in cached_spoken_forms(
+            name, words_to_exclude, minimum_term_length, generate_subsequences
+        ):
+            current_length = shortest.get(spoken_form)
+            if current_length is None or name_length < current_length:
+                shortest[spoken_form] = name_length
+                final_spoken_forms[spoken_form] = value
+
+    return final_spoken_forms
 
 
 @mod.action_class
@@ -468,33 +674,15 @@ class Actions:
         generate_subsequences: bool = True,
     ) -> list[str]:
         """Create spoken forms for a given source"""
-
-        spoken_forms_without_symbols = create_spoken_forms_from_regex(
-            source, REGEX_NO_SYMBOLS
-        )
-
-        # todo: this could probably be optimized out if there's no symbols
-        spoken_forms_with_symbols = create_spoken_forms_from_regex(
-            source, REGEX_WITH_SYMBOLS
-        )
-
-        # some may be identical, so ensure the list is reduced
-        spoken_forms = set(spoken_forms_with_symbols + spoken_forms_without_symbols)
-
-        # only generate the subsequences if requested
-        if generate_subsequences:
-            # todo: do we care about the subsequences that are excluded.
-            # the only one that seems relevant are the full spoken form for
-            spoken_forms.update(
-                generate_string_subsequences(
-                    spoken_forms_without_symbols[-1],
-                    words_to_exclude or [],
-                    minimum_term_length,
-                )
+        # Callers get a fresh list so mutating it can't poison the cache
+        return list(
+            cached_spoken_forms(
+                source,
+                tuple(words_to_exclude or ()),
+                minimum_term_length,
+                generate_subsequences,
             )
-
-        # Avoid empty spoken forms.
-        return [x for x in spoken_forms if x]
+        )
 
     def create_spoken_forms_from_list(
         sources: list[str],
@@ -517,23 +705,9 @@ class Actions:
         generate_subsequences: bool = True,
     ) -> dict[str, Any]:
         """Create spoken forms for all sources in a map, doing conflict resolution"""
-        all_spoken_forms: defaultdict[str, list[SpeakableItem]] = defaultdict(list)
+        return build_spoken_form_map(
+            sources, words_to_exclude, minimum_term_length, generate_subsequences
+        )
 
-        for name, value in sources.items():
-            spoken_forms = actions.user.create_spoken_forms(
-                name, words_to_exclude, minimum_term_length, generate_subsequences
-            )
-            for spoken_form in spoken_forms:
-                all_spoken_forms[spoken_form].append(SpeakableItem(name, value))
-
-        final_spoken_forms = {}
-        for spoken_form, spoken_form_sources in all_spoken_forms.items():
-            if len(spoken_form_sources) > 1:
-                final_spoken_forms[spoken_form] = min(
-                    spoken_form_sources,
-                    key=lambda speakable_item: len(speakable_item.name),
-                ).value
-            else:
-                final_spoken_forms[spoken_form] = spoken_form_sources[0].value
 
-        return final_spoken_forms
+app.register("ready", load_spoken_forms_cache)
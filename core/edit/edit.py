@@ -10,6 +10,13 @@ mod.setting(
     desc="Time in seconds to wait for the clipboard to change when trying to get selected text",
 )
 
+mod.setting(
+    "bulk_edit_select_threshold",
+    type=int,
+    default=0,
+    desc="When deleting at least this many characters at once (e.g. clearing a long phrase), select them and delete the selection instead of sending one backspace per character. 0 disables this, which is safest for terminals, where shift-arrow selection usually doesn't work.",
+)
+
 END_OF_WORD_SYMBOLS = ".!?;:—_/\\|@#$%^&*()[]{}<>=+-~`"
 
 
@@ -91,6 +98,46 @@ class Actions:
         """Delete character to the right"""
         actions.key("delete")
 
+    # ----- Bulk character edits -----
+    # Key repeat counts ("left:12") send a run of key presses in one call
+    # rather than one action call per character.
+    def delete_left_chars(n: int):
+        """Delete n characters to the left of the cursor"""
+        if n <= 0:
+            return
+        threshold = settings.get("user.bulk_edit_select_threshold")
+        if threshold and n >= threshold:
+            actions.key(f"shift-left:{n}")
+            actions.key("backspace")
+        else:
+            actions.key(f"backspace:{n}")
+
+    def delete_right_chars(n: int):
+        """Delete n characters to the right of the cursor"""
+        if n <= 0:
+            return
+        threshold = settings.get("user.bulk_edit_select_threshold")
+        if threshold and n >= threshold:
+            actions.key(f"shift-right:{n}")
+            actions.key("delete")
+        else:
+            actions.key(f"delete:{n}")
+
+    def move_left_chars(n: int):
+        """Move the cursor n characters left"""
+        if n > 0:
+            actions.key(f"left:{n}")
+
+    def move_right_chars(n: int):
+        """Move the cursor n characters right"""
+        if n > 0:
+            actions.key(f"right:{n}")
+
+    def extend_left_chars(n: int):
+        """Extend the selection n characters left"""
+        if n > 0:
+            actions.key(f"shift-left:{n}")
+
     def delete_all():
         """Delete all text in the current document"""
         actions.edit.select_all()
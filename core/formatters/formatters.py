@@ -1,6 +1,7 @@
 import logging
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Callable, Optional, Union
 
 from talon import Context, Module, actions, app, registry
@@ -10,6 +11,15 @@ from talon.grammar import Phrase
 from ..text.text_and_dictation import dictation_formatter
 
 
+# Patterns used on every formatted insert, compiled once
+NON_CODE_CHARACTERS = re.compile(r"[^\w\d\s.,]+")
+NON_ALPHANUMERIC_SPLIT = re.compile(r"([^\w\d]+)")
+WHITESPACE_SPLIT = re.compile(r"(\s+)")
+WHITESPACE = re.compile(r"\s+")
+FIRST_WORD = re.compile(r"^\s*\S+")
+CODE_DELIMITERS = re.compile(r"[-_.:/]+")
+
+
 class Formatter(ABC):
     def __init__(self, id: str):
         self.id = id
@@ -72,9 +82,9 @@ class CodeFormatter(Formatter):
         format_rest: Callable[[str], str],
     ):
         # Strip anything that is not alpha-num, whitespace, dot or comma
-        text = re.sub(r"[^\w\d\s.,]+", "", text)
+        text = NON_CODE_CHARACTERS.sub("", text)
         # Split on anything that is not alpha-num
-        words = re.split(r"([^\w\d]+)", text)
+        words = NON_ALPHANUMERIC_SPLIT.split(text)
         groups = []
         group = []
         first = True
@@ -113,7 +123,7 @@ class TitleFormatter(Formatter):
     )
 
     def format(self, text: str) -> str:
-        words = [x for x in re.split(r"(\s+)", text) if x]
+        words = [x for x in WHITESPACE_SPLIT.split(text) if x]
         words = self._title_case_words(words)
         return "".join(words)
 
@@ -152,7 +162,7 @@ class TitleFormatter(Formatter):
 
 class CapitalizeFormatter(Formatter):
     def format(self, text: str) -> str:
-        return re.sub(r"^\s*\S+", lambda m: capitalize_first(m.group()), text)
+        return FIRST_WORD.sub(lambda m: capitalize_first(m.group()), text)
 
     def unformat(self, text: str) -> str:
         return unformat_upper(text)
@@ -161,7 +171,7 @@ class CapitalizeFormatter(Formatter):
 class SentenceFormatter(Formatter):
     def format(self, text: str) -> str:
         """Capitalize first word if it's already all lower case"""
-        words = [x for x in re.split(r"(\s+)", text) if x]
+        words = [x for x in WHITESPACE_SPLIT.split(text) if x]
         for i in range(len(words)):
             word = words[i]
             if word.isspace():
@@ -196,7 +206,7 @@ def unformat_upper(text: str) -> str:
 def remove_code_formatting(text: str) -> str:
     """Remove format from text"""
     # Split on delimiters.
-    result = re.sub(r"[-_.:/]+", " ", text)
+    result = CODE_DELIMITERS.sub(" ", text)
     # Split camel case. Including numbers
     result = de_camel(result)
     # Delimiter/camel case successfully split. Lower case to restore "original" text.
@@ -205,8 +215,7 @@ def remove_code_formatting(text: str) -> str:
     return text
 
 
-def de_camel(text: str) -> str:
-    """Replacing camelCase boundaries with blank space"""
+def _camel_boundaries() -> re.Pattern:
     Ll = "a-zåäö"
     Lu = "A-ZÅÄÖ"
     L = f"{Ll}{Lu}"
@@ -214,13 +223,19 @@ def de_camel(text: str) -> str:
     upper_to_last_upper = rf"(?<=[L{Lu}])(?=[{Lu}][{Ll}])"  # IP|Address
     letter_to_digit = rf"(?<=[{L}])(?=[\d])"  # version|10
     digit_to_letter = rf"(?<=[\d])(?=[{L}])"  # 2|x
-    return re.sub(
-        rf"{low_to_upper}|{upper_to_last_upper}|{letter_to_digit}|{digit_to_letter}",
-        " ",
-        text,
+    return re.compile(
+        rf"{low_to_upper}|{upper_to_last_upper}|{letter_to_digit}|{digit_to_letter}"
     )
 
 
+CAMEL_BOUNDARIES = _camel_boundaries()
+
+
+def de_camel(text: str) -> str:
+    """Replacing camelCase boundaries with blank space"""
+    return CAMEL_BOUNDARIES.sub(" ", text)
+
+
 formatter_list = [
     CustomFormatter("NOOP", lambda text: text),
     CustomFormatter("TRAILING_SPACE", lambda text: f"{text} "),
@@ -229,7 +244,7 @@ formatter_list = [
     CustomFormatter("SPACE_SURROUNDED_STRING", lambda text: f" {text} "),
     CustomFormatter("ALL_CAPS", lambda text: text.upper()),
     CustomFormatter("ALL_LOWERCASE", lambda text: text.lower()),
-    CustomFormatter("COMMA_SEPARATED", lambda text: re.sub(r"\s+", ", ", text)),
+    CustomFormatter("COMMA_SEPARATED", lambda text: WHITESPACE.sub(", ", text)),
     CustomFormatter("REMOVE_FORMATTING", remove_code_formatting),
     TitleFormatter("CAPITALIZE_ALL_WORDS"),
     # The sentence formatter being called `CAPITALIZE_FIRST_WORD` is a bit of a misnomer, but kept for backward compatibility.
@@ -293,14 +308,29 @@ def format_text_without_adding_to_history(
         return text
 
     text, pre, post = shrink_to_string_inside(text)
+    text = compile_formatters(formatters, unformat)(text)
+    return f"{pre}{text}{post}"
+
 
+@lru_cache(maxsize=128)
+def compile_formatters(formatters: str, unformat: bool = False) -> Callable[[str], str]:
+    """Compiles a comma-separated formatter string into a single callable.
+    Formatters apply right to left; with unformat, the first one applied also
+    unformats the text beforehand."""
+    steps = []
     for i, formatter_name in enumerate(reversed(formatters.split(","))):
         formatter = formatters_dict[formatter_name]
         if unformat and i == 0:
-            text = formatter.unformat(text)
-        text = formatter.format(text)
+            steps.append(formatter.unformat)
+        steps.append(formatter.format)
+    steps = tuple(steps)
 
-    return f"{pre}{text}{post}"
+    def pipeline(text: str) -> str:
+        for step in steps:
+            text = step(text)
+        return text
+
+    return pipeline
 
 
 string_delimiters = [
@@ -317,6 +347,38 @@ def shrink_to_string_inside(text: str) -> tuple[str, str, str]:
     return text, "", ""
 
 
+# Golden corpus for the formatters: (formatters, text, unformat) -> expected.
+# Checked at load so tuning the hot paths can't silently change output.
+_formatter_golden_corpus = {
+    ("SNAKE_CASE", "the lord of the rings", False): "the_lord_of_the_rings",
+    ("SNAKE_CASE", "self-driving car, fast.", False): "selfdriving_car, fast. ",
+    ("PRIVATE_CAMEL_CASE", "the lord of the rings", False): "theLordOfTheRings",
+    ("PUBLIC_CAMEL_CASE", "self-driving car, fast.", False): "SelfdrivingCar, Fast. ",
+    ("ALL_SLASHES", "the lord of the rings", False): "/the/lord/of/the/rings",
+    ("DOT_SEPARATED", "IPAddress version10 2x", False): "ipaddressversion10 2x ",
+    ("CAPITALIZE_ALL_WORDS", "the lord of the rings", False): "The Lord of the Rings",
+    ("CAPITALIZE_ALL_WORDS", "self-driving car, fast.", False): "Self-Driving Car, Fast.",
+    ("CAPITALIZE_FIRST_WORD", "the lord of the rings", False): "The lord of the rings",
+    ("CAPITALIZE", "IPAddress version10 2x", False): "IPAddress version10 2x",
+    ("COMMA_SEPARATED", "self-driving car, fast.", False): "self-driving, car,, fast.",
+    ("SNAKE_CASE", '"quoted text"', False): '"quoted_text"',
+    ("ALL_CAPS,SNAKE_CASE", "hello world", False): "HELLO_WORLD",
+    ("SNAKE_CASE", "camelCaseWord", True): "camel_case_word",
+    ("DASH_SEPARATED", "IPAddress", True): "ip-address",
+    ("PUBLIC_CAMEL_CASE", "ip-address v2", True): "IpAddressV2",
+    ("ALL_LOWERCASE", "HELLO WORLD", True): "hello world",
+}
+for (_formatters, _text, _unformat), _expected in _formatter_golden_corpus.items():
+    assert (
+        format_text_without_adding_to_history(_text, _formatters, _unformat)
+        == _expected
+    ), (_formatters, _text)
+assert remove_code_formatting("IPAddress version10 2x") == "ip address version 10 2 x"
+assert remove_code_formatting("snake_case-and.dots:colons/slash") == (
+    "snake case and dots colons slash"
+)
+
+
 @mod.capture(
     rule="({user.code_formatter} | {user.prose_formatter} | {user.reformatter})+"
 )
@@ -1,20 +1,110 @@
 import logging
+from collections import deque
+from itertools import islice
+from typing import Iterator, Optional
 
 from talon import Module, actions, imgui
 
 mod = Module()
 
-# list of recent phrases, most recent first
-phrase_history = []
+
+class PhraseHistory:
+    """Fixed-capacity history of recent phrases, most recent first.
+
+    Adding a phrase is O(1); the oldest one drops off once full. Alongside the
+    phrases it keeps a lower-cased copy of each and the total character count,
+    so the history can be searched as one continuous buffer (oldest to newest)
+    without joining it up on every call.
+    """
+
+    def __init__(self, capacity: int):
+        self._phrases: deque[str] = deque(maxlen=capacity)
+        self._lower: deque[str] = deque(maxlen=capacity)
+        self.total_chars = 0
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    def __getitem__(self, index: int) -> str:
+        return self._phrases[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._phrases)
+
+    def add(self, text: str):
+        if len(self._phrases) == self._phrases.maxlen:
+            self.total_chars -= len(self._phrases[-1])
+        self._phrases.appendleft(text)
+        self._lower.appendleft(text.lower())
+        self.total_chars += len(text)
+
+    def latest(self) -> str:
+        return self._phrases[0] if self._phrases else ""
+
+    def pop_latest(self) -> str:
+        """Removes and returns the most recent phrase. Raises IndexError if empty."""
+        text = self._phrases.popleft()
+        self._lower.popleft()
+        self.total_chars -= len(text)
+        return text
+
+    def tail(self, n_chars: int) -> str:
+        """The last n_chars characters of the buffer"""
+        parts = []
+        for text in self._phrases:
+            if n_chars <= 0:
+                break
+            parts.append(text[-n_chars:])
+            n_chars -= len(text)
+        return "".join(reversed(parts))
+
+    def trim_chars(self, n_chars: int):
+        """Removes n_chars characters from the newest end of the buffer,
+        dropping phrases that are used up and shortening the last one touched."""
+        while n_chars > 0 and self._phrases:
+            text = self._phrases[0]
+            if len(text) <= n_chars:
+                n_chars -= len(text)
+                self.pop_latest()
+            else:
+                keep = len(text) - n_chars
+                self._phrases[0] = text[:keep]
+                self._lower[0] = self._lower[0][:keep]
+                self.total_chars -= n_chars
+                n_chars = 0
+
+    def rfind_distance(self, target: str) -> Optional[int]:
+        """Case-insensitive search for the last occurrence of target in the
+        buffer, which may span phrases. Returns the number of characters from
+        the start of the match to the end of the buffer, or None."""
+        target = target.lower()
+        if not target:
+            return 0
+        # Walk newest to oldest. Each phrase is searched together with the
+        # start of the text that follows it, so matches spanning a boundary are
+        # found; the first hit is the last occurrence in the buffer.
+        following = ""
+        newer_chars = 0
+        for lower in self._lower:
+            position = (lower + following).rfind(target)
+            if position != -1:
+                return len(lower) - position + newer_chars
+            following = (lower + following)[: len(target) - 1]
+            newer_chars += len(lower)
+        return None
+
+
 phrase_history_length = 40
 phrase_history_display_length = 40
+# recent phrases, most recent first
+phrase_history = PhraseHistory(phrase_history_length)
 
 
 @mod.action_class
 class Actions:
     def get_last_phrase() -> str:
         """Gets the last phrase"""
-        return phrase_history[0] if phrase_history else ""
+        return phrase_history.latest()
 
     def get_recent_phrase(number: int) -> str:
         """Gets the nth most recent phrase"""
@@ -33,30 +123,27 @@ class Actions:
         if not phrase_history:
             logging.warning("clear_last_phrase(): No last phrase to clear!")
             return
-        for _ in phrase_history.pop(0):
-            actions.key("backspace")
+        actions.user.delete_left_chars(len(phrase_history.pop_latest()))
 
     def select_last_phrase():
         """Selects the last phrase"""
         if not phrase_history:
             logging.warning("select_last_phrase(): No last phrase to select!")
             return
-        for _ in phrase_history[0]:
-            actions.edit.extend_left()
+        actions.user.extend_left_chars(len(phrase_history.latest()))
 
     def before_last_phrase():
         """Moves left before the last phrase"""
         try:
-            for _ in phrase_history.pop(0):
-                actions.edit.left()
+            text = phrase_history.pop_latest()
         except IndexError:
             logging.warning("before_last_phrase(): No last phrase to move before!")
+            return
+        actions.user.move_left_chars(len(text))
 
     def add_phrase_to_history(text: str):
         """Adds a phrase to the phrase history"""
-        global phrase_history
-        phrase_history.insert(0, text)
-        phrase_history = phrase_history[:phrase_history_length]
+        phrase_history.add(text)
 
     def toggle_phrase_history():
         """Toggles list of recent phrases"""
@@ -77,7 +164,9 @@ def gui(gui: imgui.GUI):
     gui.text("Say 'recent repeat <number>' retype a phrase on this list.")
     gui.text("Say 'recent copy <number>' to copy a phrase from this list.")
     gui.line()
-    for index, text in enumerate(phrase_history[:phrase_history_display_length], 1):
+    for index, text in enumerate(
+        islice(phrase_history, phrase_history_display_length), 1
+    ):
         gui.text(f"{index}: {text}")
 
     gui.spacer()
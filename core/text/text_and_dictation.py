@@ -1,5 +1,7 @@
 # Descended from https://github.com/dwiel/talon_community/blob/master/misc/dictation.py
 import re
+import time
+from collections import OrderedDict
 from typing import Callable, Optional
 
 from talon import Context, Module, actions, grammar, settings, ui
@@ -22,6 +24,13 @@ mod.setting(
     desc="This is the character inserted during dictation_peek to ensure that some text is selected even if the cursor is at the start or end of the document. This should be a single character only.",
 )
 
+mod.setting(
+    "context_sensitive_dictation_reuse_timeout",
+    type=float,
+    default=10.0,
+    desc="Seconds after a dictation insert during which the next dictation insert into the same window reuses the known surrounding text instead of peeking, provided no focus change, key press, voice mouse click or other insert happened in between. Keys typed on a physical keyboard and physical mouse clicks are not seen, hence the timeout. 0 disables reuse.",
+)
+
 mod.list("prose_modifiers", desc="Modifiers that can be used within prose")
 mod.list("prose_snippets", desc="Snippets that can be used within prose")
 mod.list("phrase_ender", "List of commands that can be used to end a phrase")
@@ -385,6 +394,10 @@ class DictationFormat:
         self.force_capitalization = None  # Can also be "cap" or "no cap".
 
     def reset_context(self):
+        # The shared dictation_formatter is also reset outside dictation_insert
+        # (no space, format reset); those callers must invalidate
+        # insertion_tracker too, or the next insert skips the peek and formats
+        # against this blank "sentence start" context instead of the real text.
         self.before = ""
         self.state = "sentence start"
 
@@ -432,6 +445,17 @@ class DictationFormat:
         self.reset_context()
         self.force_no_space = True
 
+    def snapshot(self) -> tuple:
+        return (self.before, self.state, self.force_no_space, self.force_capitalization)
+
+    def restore(self, snapshot: tuple):
+        (
+            self.before,
+            self.state,
+            self.force_no_space,
+            self.force_capitalization,
+        ) = snapshot
+
 
 def format_first_letter(text, formatter):
     i = -1
@@ -443,9 +467,113 @@ def format_first_letter(text, formatter):
     return text
 
 
+class InsertionTracker:
+    """Remembers where our last dictation insert left the cursor, so the next
+    insert into the same window can skip dictation_peek. The text before the
+    cursor is already in the dictation formatter; this keeps the text after it
+    (or None if unknown). Any key press, insert, voice mouse click, focus change
+    or reset of the formatter context invalidates it."""
+
+    def __init__(self):
+        self.invalidate()
+
+    def invalidate(self):
+        self.window_id = None
+        self.after = None
+        self.time = 0.0
+
+    def record(self, after: Optional[str]):
+        self.window_id = ui.active_window().id
+        self.after = after
+        self.time = time.monotonic()
+
+    def can_skip_peek(self, need_right: bool) -> bool:
+        timeout = settings.get("user.context_sensitive_dictation_reuse_timeout")
+        if self.window_id is None or timeout <= 0:
+            return False
+        if time.monotonic() - self.time > timeout:
+            return False
+        if need_right and self.after is None:
+            return False
+        return ui.active_window().id == self.window_id
+
+    def snapshot(self) -> tuple:
+        return (self.window_id, self.after, self.time)
+
+    def restore(self, snapshot: tuple):
+        self.window_id, self.after, self.time = snapshot
+
+
+def reset_dictation_context():
+    dictation_formatter.reset()
+    insertion_tracker.invalidate()
+
+
+# ---------- PER-WINDOW DICTATION STATE ---------- #
+# dictation_formatter stays a single object (other modules hold a reference to
+# it); when focus moves between windows its state, and the insertion tracker's,
+# is stashed for the window being left and restored for the one being entered.
+# Only the most recently used windows are kept.
+WINDOW_STATES_MAX = 16
+window_states: OrderedDict[int, tuple[tuple, tuple]] = OrderedDict()
+dictation_window_id: Optional[int] = None
+
+
+def stash_window_state():
+    if dictation_window_id is None:
+        return
+    window_states[dictation_window_id] = (
+        dictation_formatter.snapshot(),
+        insertion_tracker.snapshot(),
+    )
+    window_states.move_to_end(dictation_window_id)
+    while len(window_states) > WINDOW_STATES_MAX:
+        window_states.popitem(last=False)
+
+
+def switch_dictation_window(window_id: Optional[int], restore_tracker: bool = False):
+    """Make the dictation state follow the given window; no-op if it already does.
+
+    The formatter state is always restored. The insertion tracker is only
+    restored when we focused the window ourselves (recall); after an ordinary
+    focus change the caret may have moved, so the next insert peeks again."""
+    global dictation_window_id
+    if window_id == dictation_window_id:
+        return
+    stash_window_state()
+    dictation_window_id = window_id
+    saved = window_states.pop(window_id, None)
+    if saved:
+        dictation_formatter.restore(saved[0])
+        if restore_tracker:
+            insertion_tracker.restore(saved[1])
+        else:
+            insertion_tracker.invalidate()
+    else:
+        reset_dictation_context()
+
+
 dictation_formatter = DictationFormat()
-ui.register("app_deactivate", lambda app: dictation_formatter.reset())
-ui.register("win_focus", lambda win: dictation_formatter.reset())
+insertion_tracker = InsertionTracker()
+ui.register("app_deactivate", lambda app: switch_dictation_window(None))
+ui.register("win_focus", lambda win: switch_dictation_window(win.id))
+
+
+@ctx.action_class("main")
+class MainActions:
+    # Anything else typed into the window makes the tracked context stale
+    def key(key: str):
+        insertion_tracker.invalidate()
+        actions.next(key)
+
+    def insert(text: str):
+        insertion_tracker.invalidate()
+        actions.next(text)
+
+    # A click can move the caret without leaving the window
+    def mouse_click(button: int = 0):
+        insertion_tracker.invalidate()
+        actions.next(button)
 
 
 def reformat_last_utterance(formatter):
@@ -460,7 +588,12 @@ def reformat_last_utterance(formatter):
 class Actions:
     def dictation_format_reset():
         """Resets the dictation formatter"""
-        return dictation_formatter.reset()
+        reset_dictation_context()
+
+    def dictation_format_switch_window():
+        """Switches the dictation formatter to the state saved for the active window.
+        Call after focusing a window programmatically, since win_focus arrives later."""
+        switch_dictation_window(ui.active_window().id, restore_tracker=True)
 
     def dictation_format_cap():
         """Sets the dictation formatter to capitalize"""
@@ -473,6 +606,7 @@ class Actions:
     def dictation_format_no_space():
         """Sets the dictation formatter to not prepend a space"""
         dictation_formatter.no_space()
+        insertion_tracker.invalidate()
 
     def dictation_reformat_cap():
         """Capitalizes the last utterance"""
@@ -514,7 +648,8 @@ class Actions:
     def dictation_insert(text: str, auto_cap: bool = True):
         """Inserts dictated text, formatted appropriately."""
         add_space_after = False
-        if settings.get("user.context_sensitive_dictation"):
+        context_sensitive = settings.get("user.context_sensitive_dictation")
+        if context_sensitive:
             # Peek left if we might need leading space or auto-capitalization;
             # peek right if we might need trailing space. NB. We peek right
             # BEFORE insertion to avoid breaking the undo-chain between the
@@ -523,8 +658,13 @@ class Actions:
                 auto_cap and text != auto_capitalize(text, "sentence start")[0]
             )
             need_right = not actions.user.omit_space_after(text)
-            before, after = actions.user.dictation_peek(need_left, need_right)
-            dictation_formatter.update_context(before)
+            if insertion_tracker.can_skip_peek(need_right):
+                # Nothing has touched the window since our last insert, so the
+                # formatter already holds the text before the cursor
+                after = insertion_tracker.after
+            else:
+                before, after = actions.user.dictation_peek(need_left, need_right)
+                dictation_formatter.update_context(before)
             add_space_after = after is not None and actions.user.needs_space_between(
                 text, after
             )
@@ -534,7 +674,10 @@ class Actions:
         # so that future dictation is properly formatted.
         text = actions.user.dictation_replace(text)
         actions.user.add_phrase_to_history(text)
-        actions.user.insert_between(text, " " if add_space_after else "")
+        suffix = " " if add_space_after else ""
+        actions.user.insert_between(text, suffix)
+        if context_sensitive:
+            insertion_tracker.record(suffix + after if after is not None else None)
 
     def dictation_peek(left: bool, right: bool) -> tuple[Optional[str], Optional[str]]:
         """
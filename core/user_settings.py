@@ -1,4 +1,6 @@
 import csv
+import hashlib
+import os
 from pathlib import Path
 from typing import IO, Callable
 
@@ -84,29 +86,63 @@ def track_csv_list(
     write_csv_defaults(path, headers, default, is_spoken_form_first)
 
     def decorator(fn: CallbackT) -> CallbackT:
+        # Editors can fire several watch callbacks for one save; skip parsing
+        # and the callback when the content hasn't actually changed
+        last_digest = None
+
         @resource.watch(str(path))
         def on_update(f):
+            nonlocal last_digest
+            digest = hashlib.sha1(f.read().encode("utf-8")).digest()
+            if digest == last_digest:
+                return
+            f.seek(0)
             data = read_csv_list(f, headers, is_spoken_form_first)
             fn(data)
+            # Only remember the content once it was applied, so a failed
+            # parse or callback is retried on the next save
+            last_digest = digest
 
     return decorator
 
 
+def needs_trailing_newline(path: Path) -> bool:
+    """Whether a non-empty file is missing its final newline. Only reads the
+    last byte, so it stays cheap as settings files grow."""
+    with open(path, "rb") as file:
+        file.seek(0, os.SEEK_END)
+        if file.tell() == 0:
+            return False
+        file.seek(-1, os.SEEK_END)
+        return file.read(1) != b"\n"
+
+
+def append_lines(path: Path, lines: list[str]):
+    """Append lines to a text file under a single open, adding a newline first
+    if the file doesn't end with one. Does nothing if there are no lines."""
+    if not lines:
+        return
+    needs_newline = needs_trailing_newline(path)
+    with open(path, "a", encoding="utf-8") as file:
+        if needs_newline:
+            file.write("\n")
+        file.write("".join(f"{line}\n" for line in lines))
+
+
 def append_to_csv(filename: str, rows: dict[str, str], private: bool = False):
     path = (PRIVATE_DIR / filename) if private else (SETTINGS_DIR / filename)
     assert filename.endswith(".csv")
+    if not rows:
+        return
 
-    with open(str(path)) as file:
-        line = None
-        for line in file:
-            pass
-        needs_newline = line is not None and not line.endswith("\n")
+    needs_newline = needs_trailing_newline(path)
     with open(path, "a", encoding="utf-8", newline="") as file:
         writer = csv.writer(file)
         if needs_newline:
             writer.writerow([])
-        for key, value in rows.items():
-            writer.writerow([key] if key == value else [value, key])
+        writer.writerows(
+            [key] if key == value else [value, key] for key, value in rows.items()
+        )
 
 
 WatchCallbackType = Callable[[IO], None]
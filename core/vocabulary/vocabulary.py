@@ -6,7 +6,7 @@ from typing import Sequence, Union
 from talon import Context, Module, actions
 from talon.grammar import Phrase
 
-from ..user_settings import append_to_csv, track_csv_list
+from ..user_settings import append_lines, append_to_csv, track_csv_list
 
 mod = Module()
 ctx = Context()
@@ -55,13 +55,29 @@ class PhraseReplacer:
       - phrase_dict: dictionary mapping recognized/spoken forms to written forms
     """
 
+    # Key under which a trie node stores the written form of the phrase ending
+    # there. Words are always strings, so it can't collide with a child.
+    WRITTEN_FORM = None
+
     def __init__(self):
-        self.phrase_index = {}
+        # Word-level trie: each node maps the next word to a child node
+        self.phrase_trie = {}
+        # The mapping last passed to update, and its entries grouped by first
+        # word, so an update only rebuilds the subtries whose entries changed
+        self.phrase_dict = {}
+        self.phrases_by_first_word = {}
 
     def update(self, phrase_dict: dict[str, str]):
-        # Index phrases by first word, then number of subsequent words n_next
-        phrase_index = dict()
+        previous = self.phrase_dict
+        affected_first_words = set()
+        for spoken_form in previous.keys() - phrase_dict.keys():
+            words = spoken_form.split()
+            if words:
+                self.phrases_by_first_word[words[0]].pop(spoken_form, None)
+                affected_first_words.add(words[0])
         for spoken_form, written_form in phrase_dict.items():
+            if previous.get(spoken_form) == written_form:
+                continue
             words = spoken_form.split()
             if not words:
                 logging.warning(
@@ -69,36 +85,49 @@ class PhraseReplacer:
                     f"{written_form}, ignored"
                 )
                 continue
-            first_word, n_next = words[0], len(words) - 1
-            phrase_index.setdefault(first_word, {}).setdefault(n_next, {})[
-                tuple(words[1:])
-            ] = written_form
-
-        # Sort n_next index so longer phrases have priority
-        self.phrase_index = {
-            first_word: sorted(same_first_word.items(), key=lambda x: -x[0])
-            for first_word, same_first_word in phrase_index.items()
-        }
+            self.phrases_by_first_word.setdefault(words[0], {})[spoken_form] = (
+                written_form
+            )
+            affected_first_words.add(words[0])
+        self.phrase_dict = dict(phrase_dict)
+
+        for first_word in affected_first_words:
+            phrases = self.phrases_by_first_word[first_word]
+            if not phrases:
+                del self.phrases_by_first_word[first_word]
+                self.phrase_trie.pop(first_word, None)
+                continue
+            subtrie = {}
+            for spoken_form, written_form in phrases.items():
+                node = subtrie
+                for word in spoken_form.split()[1:]:
+                    node = node.setdefault(word, {})
+                node[self.WRITTEN_FORM] = written_form
+            self.phrase_trie[first_word] = subtrie
 
     def replace(self, input_words: Sequence[str]) -> Sequence[str]:
-        input_words = tuple(input_words)  # tuple to ensure hashability of slices
+        input_words = tuple(input_words)
         output_words = []
         first_word_i = 0
         while first_word_i < len(input_words):
-            first_word = input_words[first_word_i]
-            next_word_i = first_word_i + 1
-            # Could this word be the first of a phrase we should replace?
-            for n_next, phrases_n_next in self.phrase_index.get(first_word, []):
-                # Yes. Perhaps a phrase with n_next subsequent words?
-                continuation = input_words[next_word_i : next_word_i + n_next]
-                if continuation in phrases_n_next:
-                    # Found a match!
-                    output_words.append(phrases_n_next[continuation])
-                    first_word_i += 1 + n_next
+            # Walk the trie as far as the input allows, remembering the longest
+            # phrase seen along the way
+            node = self.phrase_trie
+            match = None
+            word_i = first_word_i
+            while word_i < len(input_words):
+                node = node.get(input_words[word_i])
+                if node is None:
                     break
+                word_i += 1
+                if self.WRITTEN_FORM in node:
+                    match = (node[self.WRITTEN_FORM], word_i)
+            if match:
+                output_words.append(match[0])
+                first_word_i = match[1]
             else:
                 # No match, just add the word to the result
-                output_words.append(first_word)
+                output_words.append(input_words[first_word_i])
                 first_word_i += 1
         return output_words
 
@@ -125,6 +154,21 @@ assert rep.replace_string("well this is a test really") == "well it worked! real
 assert rep.replace_string("try this is too") == "try stopping early too"
 assert rep.replace_string("this is a tricky one") == "stopping early a tricky one"
 
+# Incremental updates only touch the changed first-word subtries
+rep.update(
+    {
+        "this": "foo",
+        "that": "baz",
+        "this is a test": "it worked!",
+        "gnork": "bork",
+    }
+)
+assert rep.replace_string("this that gnork") == "foo baz bork"
+assert rep.replace_string("try this is too") == "try foo is too"
+assert rep.replace_string("this is a test") == "it worked!"
+rep.update({})
+assert rep.replace_string("this is a test") == "this is a test"
+
 phrase_replacer = PhraseReplacer()
 
 
@@ -216,23 +260,15 @@ def _add_selection_to_file(
 
 
 def append_to_vocabulary(rows: dict[str, str]):
-    vocabulary_file_path = actions.user.get_vocabulary_file_path()
-    with open(str(vocabulary_file_path)) as file:
-        line = None
-        for line in file:
-            pass
-        needs_newline = line is not None and not line.endswith("\n")
-
-    with open(vocabulary_file_path, "a", encoding="utf-8") as file:
-        if needs_newline:
-            file.write("\n")
-        for key, value in rows.items():
-            if key == value:
-                file.write(f"{key}\n")
-            else:
-                if not str.isprintable(value) or "'" in value or '"' in value:
-                    value = repr(value)
-                file.write(f"{key}: {value}\n")
+    lines = []
+    for key, value in rows.items():
+        if key == value:
+            lines.append(key)
+        else:
+            if not str.isprintable(value) or "'" in value or '"' in value:
+                value = repr(value)
+            lines.append(f"{key}: {value}")
+    append_lines(actions.user.get_vocabulary_file_path(), lines)
 
 
 @mod.action_class
@@ -347,17 +347,20 @@ class Actions:
     def recall_window_and_mimic(name: str, text: str):
         """Focus a saved window, wait for context update, then mimic remaining words"""
         actions.user.recall_window(name)
+        actions.user.dictation_format_switch_window()
         actions.sleep("25ms")
         actions.mimic(text)
 
     def dictate_to_window(name: str, text: str):
         """Focus a saved window and type dictated text into it"""
         actions.user.recall_window(name)
+        actions.user.dictation_format_switch_window()
         actions.user.dictation_insert(text)
 
     def dictate_to_window_and_enter(name: str, text: str):
         """Focus a saved window, type dictated text, and press Enter"""
         actions.user.recall_window(name)
+        actions.user.dictation_format_switch_window()
         actions.user.dictation_insert(text)
         actions.sleep("50ms")
         actions.key("enter")
@@ -370,6 +373,10 @@ class Actions:
         """Show the status overlay with all saved windows"""
         recall_overlay.show_status()
 
+    def recall_status_page(step: int):
+        """Page the status overlay forward (positive) or back (negative)"""
+        recall_overlay.status_page(step)
+
     def show_recall_help():
         """Show the help overlay with command reference"""
         recall_overlay.show_help()
@@ -8,6 +8,9 @@ Windows that can't be found are shown in red at the top of the screen.
 "recall help" shows a full-screen panel with all saved windows,
 their metadata, and a command reference. Auto-hides after 30s.
 
+Labels are drawn on a canvas per screen that actually holds a saved window;
+panels and flashes follow the focused window's screen.
+
 Status, help, and prompt sub-overlays use DismissibleOverlay.
 Label, flash, highlight, and persistent overlays remain manual.
 """
@@ -18,9 +21,14 @@ from talon.screen import Screen
 from talon.skia.canvas import Canvas as SkiaCanvas
 from talon.ui import Rect
 
-from .utils.overlay_kit import DismissibleOverlay, draw_close_hint, draw_dim_backdrop, draw_panel_frame, draw_rounded_rect, draw_separator
+from .utils.overlay_kit import (
+    BorderBand, DismissibleOverlay, active_screen, canvas_pool, draw_close_hint,
+    draw_dim_backdrop, draw_panel_frame, draw_rounded_rect, draw_separator,
+    overlay_stats, screen_for_rect, screen_key,
+)
 
-canvas: Canvas = None
+# Label canvases by screen_key — only screens that hold a saved window
+_label_canvases: dict[tuple, Canvas] = {}
 _hide_job = None
 
 # Padding and styling constants
@@ -87,7 +95,7 @@ def _resolve_command_shell(stored: str) -> str | None:
 def _update_overlay_tag():
     """Set or clear the overlay_visible tag based on active canvases."""
     from .recall_state import overlay_ctx
-    if canvas or _status_overlay.is_showing or _help_overlay.is_showing or _prompt_overlay.is_showing:
+    if _label_canvases or _status_overlay.is_showing or _help_overlay.is_showing or _prompt_overlay.is_showing:
         overlay_ctx.tags = ["user.recall_overlay_visible"]
     else:
         overlay_ctx.tags = []
@@ -99,22 +107,24 @@ def _pills_overlap(a: Rect, b: Rect) -> bool:
             a.y < b.y + b.height and a.y + a.height > b.y)
 
 
-def on_draw(c: SkiaCanvas):
-    saved_windows, find_window_by_id = _get_saved_windows()
-    screen = ui.main_screen()
+def _make_label_draw(screen: Screen, entries: list):
+    """Bind a label draw callback to one screen and its (name, id, window) entries."""
+    def on_draw(c: SkiaCanvas):
+        _draw_labels(c, screen, entries)
+    return on_draw
+
 
+def _draw_labels(c: SkiaCanvas, screen: Screen, entries: list):
     try:
         active_id = ui.active_window().id
     except Exception:
         active_id = None
 
-    missing_y_offset = 80  # start below top bar area
+    missing_y_offset = screen.rect.y + 80  # start below top bar area
 
     # First pass: compute pill positions
     pills = []  # [(name, pill_rect, text_x, text_y, bg_color, text_color)]
-    for name, info in saved_windows.items():
-        window = find_window_by_id(info["id"])
-
+    for name, window_id, window in entries:
         c.paint.textsize = FONT_SIZE
         text_rect = c.paint.measure_text(name)[1]
         text_w = text_rect.width
@@ -131,7 +141,7 @@ def on_draw(c: SkiaCanvas):
             if rect.width <= 0 or rect.height <= 0:
                 continue
 
-            is_active = (info["id"] == active_id)
+            is_active = (window_id == active_id)
 
             # Center label on window
             center_x = rect.x + rect.width / 2
@@ -186,29 +196,55 @@ def on_draw(c: SkiaCanvas):
         c.draw_text(name, pill_rect.x + PAD_X, text_y)
 
 
+def _group_labels_by_screen() -> dict[tuple, tuple[Screen, list]]:
+    """Route each saved window to the screen owning its rect.
+    Windows that can't be found are listed on the main screen."""
+    saved_windows, find_window_by_id = _get_saved_windows()
+    groups: dict[tuple, tuple[Screen, list]] = {}
+    main = ui.main_screen()
+    for name, info in saved_windows.items():
+        window = find_window_by_id(info["id"])
+        screen = main
+        if window is not None:
+            try:
+                rect = window.rect
+            except AttributeError:
+                continue
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            screen = screen_for_rect(rect)
+        key = screen_key(screen)
+        if key not in groups:
+            groups[key] = (screen, [])
+        groups[key][1].append((name, info["id"], window))
+    return groups
+
+
 def show_overlay():
     """Show labels on all saved windows for 5 seconds."""
-    global canvas, _hide_job
+    global _hide_job
 
     # Cancel any pending hide
     if _hide_job:
         cron.cancel(_hide_job)
         _hide_job = None
 
-    # Tear down existing canvas before creating new one
-    if canvas:
-        canvas.unregister("draw", on_draw)
-        canvas.close()
-        canvas = None
+    groups = _group_labels_by_screen()
 
-    saved_windows, _ = _get_saved_windows()
-    if not saved_windows:
+    # Hand back canvases for screens that no longer hold any labels
+    for key in list(_label_canvases):
+        if key not in groups:
+            canvas_pool.release(_label_canvases.pop(key))
+
+    if not groups:
+        _update_overlay_tag()
         return
 
-    screen: Screen = ui.main_screen()
-    canvas = Canvas.from_screen(screen)
-    canvas.register("draw", on_draw)
-    canvas.freeze()
+    # Reuses the pooled per-screen canvas (draw callback rebound to new entries)
+    for key, (screen, entries) in groups.items():
+        canvas = canvas_pool.acquire("labels", _make_label_draw(screen, entries), screen=screen)
+        _label_canvases[key] = canvas
+        canvas.freeze()
 
     # Auto-hide after duration
     _hide_job = cron.after(SHOW_DURATION, hide_overlay)
@@ -216,15 +252,14 @@ def show_overlay():
 
 
 def hide_overlay():
-    """Hide and destroy the overlay canvas."""
-    global canvas, _hide_job
+    """Hide the label canvases and return them to the pool."""
+    global _hide_job
     if _hide_job:
         cron.cancel(_hide_job)
         _hide_job = None
-    if canvas:
-        canvas.unregister("draw", on_draw)
-        canvas.close()
-        canvas = None
+    for canvas in _label_canvases.values():
+        canvas_pool.release(canvas)
+    _label_canvases.clear()
     _update_overlay_tag()
 
 
@@ -253,10 +288,43 @@ HELP_COMMANDS = [
 
 # ── Status overlay (saved windows panel) ─────────────────────────────
 
-def _on_draw_status(c: SkiaCanvas, overlay: DismissibleOverlay):
+# Snapshot of (name, is_running) rows taken when the panel opens, so drawing
+# only touches the visible page instead of re-scanning every saved window.
+_status_rows: list[tuple[str, bool]] = []
+_status_page: int = 0
+
+# Every row is laid out at the tallest size (name + detail line) so pages
+# have a fixed capacity and paging is predictable.
+STATUS_ROW_HEIGHT = HELP_NAME_SIZE + 8 + HELP_DETAIL_SIZE + 4 + HELP_ROW_PAD
+STATUS_FOOTER_HEIGHT = HELP_DETAIL_SIZE + 16
+
+
+def _snapshot_status_rows():
+    """Sort saved windows once: running windows first, then alphabetically."""
+    global _status_rows
     saved_windows, find_window_by_id = _get_saved_windows()
-    screen = ui.main_screen()
-    sr = screen.rect
+    rows = [
+        (name, find_window_by_id(info["id"]) is not None)
+        for name, info in saved_windows.items()
+    ]
+    rows.sort(key=lambda row: (0 if row[1] else 1, row[0].lower()))
+    _status_rows = rows
+
+
+def _status_rows_per_page(sr: Rect) -> int:
+    """How many rows fit in a screen-clamped panel."""
+    available = sr.height - 40 - HELP_PANEL_PAD * 2 - (HELP_HEADER_SIZE + 20) - STATUS_FOOTER_HEIGHT
+    return max(1, int(available // STATUS_ROW_HEIGHT))
+
+
+def _status_page_count(sr: Rect) -> int:
+    per_page = _status_rows_per_page(sr)
+    return max(1, (len(_status_rows) + per_page - 1) // per_page)
+
+
+def _on_draw_status(c: SkiaCanvas, overlay: DismissibleOverlay):
+    saved_windows, _ = _get_saved_windows()
+    sr = overlay.screen.rect
 
     # Full-screen dim background
     draw_dim_backdrop(c, sr, HELP_BG_COLOR)
@@ -264,27 +332,19 @@ def _on_draw_status(c: SkiaCanvas, overlay: DismissibleOverlay):
     # Centered panel
     panel_w = sr.width * 0.55
 
-    # Sort: alphabetically by name, active windows first within that
-    window_names = sorted(
-        saved_windows.keys(),
-        key=lambda n: (0 if find_window_by_id(saved_windows[n]["id"]) else 1, n.lower()),
-    )
+    # Only the current page is measured and drawn
+    per_page = _status_rows_per_page(sr)
+    page_count = _status_page_count(sr)
+    page = min(_status_page, page_count - 1)
+    visible = _status_rows[page * per_page:(page + 1) * per_page]
 
-    # Pre-calculate panel height
     panel_h = HELP_PANEL_PAD  # top padding
     panel_h += HELP_HEADER_SIZE + 20  # header + gap
-    for name in window_names:
-        info = saved_windows[name]
-        panel_h += HELP_NAME_SIZE + 8
-        if info.get("path") or info.get("command"):
-            panel_h += HELP_DETAIL_SIZE + 4
-        panel_h += HELP_ROW_PAD
+    panel_h += len(visible) * STATUS_ROW_HEIGHT
+    if page_count > 1:
+        panel_h += STATUS_FOOTER_HEIGHT
     panel_h += HELP_PANEL_PAD  # bottom padding
 
-    # Clamp to screen
-    if panel_h > sr.height - 40:
-        panel_h = sr.height - 40
-
     panel_x = sr.x + (sr.width - panel_w) / 2
     panel_y = sr.y + (sr.height - panel_h) / 2
 
@@ -310,15 +370,19 @@ def _on_draw_status(c: SkiaCanvas, overlay: DismissibleOverlay):
     cy += HELP_HEADER_SIZE + 20
 
     # Window rows
-    for name in window_names:
-        info = saved_windows[name]
-        window = find_window_by_id(info["id"])
+    for name, is_running in visible:
+        info = saved_windows.get(name)
+        if info is None:
+            # Forgotten/renamed since the snapshot; keep the slot so rows don't shift
+            cy += STATUS_ROW_HEIGHT
+            continue
+        row_top = cy
 
         # Status dot
         dot_radius = 5
         dot_x = cx + dot_radius
         dot_y = cy + HELP_NAME_SIZE / 2 + 2
-        c.paint.color = HELP_GREEN if window else HELP_RED
+        c.paint.color = HELP_GREEN if is_running else HELP_RED
         c.draw_circle(dot_x, dot_y, dot_radius)
 
         # Name line: name / aliases    AppName    [command_name]
@@ -346,37 +410,39 @@ def _on_draw_status(c: SkiaCanvas, overlay: DismissibleOverlay):
 
         # Detail line
         path = info.get("path")
+        detail = None
         if command and path:
-            shell_cmd = _resolve_command_shell(command)
-            c.paint.textsize = HELP_DETAIL_SIZE
-            c.paint.color = HELP_DIM_COLOR
-            c.draw_text(f"cd {path} && {shell_cmd}", name_x, cy + HELP_DETAIL_SIZE)
-            cy += HELP_DETAIL_SIZE + 4
+            detail = f"cd {path} && {_resolve_command_shell(command)}"
         elif command:
-            shell_cmd = _resolve_command_shell(command)
-            c.paint.textsize = HELP_DETAIL_SIZE
-            c.paint.color = HELP_DIM_COLOR
-            c.draw_text(f"$ {shell_cmd}", name_x, cy + HELP_DETAIL_SIZE)
-            cy += HELP_DETAIL_SIZE + 4
+            detail = f"$ {_resolve_command_shell(command)}"
         elif path:
+            detail = path
+        if detail:
             c.paint.textsize = HELP_DETAIL_SIZE
             c.paint.color = HELP_DIM_COLOR
-            c.draw_text(path, name_x, cy + HELP_DETAIL_SIZE)
-            cy += HELP_DETAIL_SIZE + 4
+            c.draw_text(detail, name_x, cy + HELP_DETAIL_SIZE)
 
-        cy += HELP_ROW_PAD
+        cy = row_top + STATUS_ROW_HEIGHT
 
         # Separator line
         draw_separator(c, cx, cx + content_w, cy - HELP_ROW_PAD / 2, HELP_LINE_COLOR)
 
+    # Page footer
+    if page_count > 1:
+        c.paint.textsize = HELP_DETAIL_SIZE
+        c.paint.color = HELP_DIM_COLOR
+        c.draw_text(
+            f'Page {page + 1}/{page_count}  ({len(_status_rows)} windows)    "recall status next" / "recall status previous"',
+            cx, cy + HELP_DETAIL_SIZE + 8,
+        )
+
     c.restore()
 
 
 # ── Help overlay (commands reference panel) ──────────────────────────
 
 def _on_draw_help(c: SkiaCanvas, overlay: DismissibleOverlay):
-    screen = ui.main_screen()
-    sr = screen.rect
+    sr = overlay.screen.rect
 
     # Full-screen dim background
     draw_dim_backdrop(c, sr, HELP_BG_COLOR)
@@ -453,8 +519,7 @@ PROMPT_CORNER_RADIUS = 16
 
 
 def _on_draw_prompt(c: SkiaCanvas, overlay: DismissibleOverlay):
-    screen = ui.main_screen()
-    sr = screen.rect
+    sr = overlay.screen.rect
 
     # Dim background
     draw_dim_backdrop(c, sr, HELP_BG_COLOR)
@@ -507,22 +572,39 @@ def _on_prompt_hide():
 
 _status_overlay = DismissibleOverlay(
     on_draw=_on_draw_status, auto_hide=None, on_hide=_update_overlay_tag,
+    name="status",
 )
 _help_overlay = DismissibleOverlay(
     on_draw=_on_draw_help, auto_hide=None, on_hide=_update_overlay_tag,
+    name="help",
 )
 _prompt_overlay = DismissibleOverlay(
     on_draw=_on_draw_prompt, auto_hide=PROMPT_DURATION, on_hide=_on_prompt_hide,
+    name="prompt",
 )
 
 
 def show_status():
     """Show the status overlay with all saved windows."""
+    global _status_page
     hide_help()
+    _snapshot_status_rows()
+    _status_page = 0
     _status_overlay.show()
     _update_overlay_tag()
 
 
+def status_page(step: int):
+    """Page the status overlay forward/back, opening it if needed."""
+    global _status_page
+    if not _status_overlay.is_showing:
+        show_status()
+        return
+    page_count = _status_page_count(_status_overlay.screen.rect)
+    _status_page = max(0, min(_status_page + step, page_count - 1))
+    _status_overlay.freeze()
+
+
 def hide_status():
     """Hide and destroy the status overlay canvas."""
     _status_overlay.hide()
@@ -565,6 +647,7 @@ def hide_any():
 # ── Flash notification ────────────────────────────────────────────────
 
 _flash_canvas: Canvas = None
+_flash_screen: Screen = None
 _flash_hide_job = None
 _flash_message: str = ""
 _flash_subtitle: str = ""
@@ -581,8 +664,7 @@ FLASH_CORNER = 12
 
 
 def on_draw_flash(c: SkiaCanvas):
-    screen = ui.main_screen()
-    sr = screen.rect
+    sr = (_flash_screen or ui.main_screen()).rect
 
     c.paint.textsize = FLASH_FONT_SIZE
     text_rect = c.paint.measure_text(_flash_message)[1]
@@ -635,7 +717,7 @@ def on_draw_flash(c: SkiaCanvas):
 
 def flash(message: str, subtitle: str = ""):
     """Show a brief centered notification pill with optional subtitle."""
-    global _flash_canvas, _flash_hide_job, _flash_message, _flash_subtitle
+    global _flash_canvas, _flash_screen, _flash_hide_job, _flash_message, _flash_subtitle
     _flash_message = message
     _flash_subtitle = subtitle
 
@@ -643,14 +725,12 @@ def flash(message: str, subtitle: str = ""):
         cron.cancel(_flash_hide_job)
         _flash_hide_job = None
 
-    if _flash_canvas:
-        _flash_canvas.unregister("draw", on_draw_flash)
-        _flash_canvas.close()
-        _flash_canvas = None
-
-    screen: Screen = ui.main_screen()
-    _flash_canvas = Canvas.from_screen(screen)
-    _flash_canvas.register("draw", on_draw_flash)
+    # Show on the monitor the user is looking at (the focused window's)
+    _flash_screen = active_screen()
+    flash_canvas = canvas_pool.acquire("flash", on_draw_flash, screen=_flash_screen)
+    if _flash_canvas and _flash_canvas is not flash_canvas:
+        canvas_pool.release(_flash_canvas)
+    _flash_canvas = flash_canvas
     _flash_canvas.freeze()
 
     _flash_hide_job = cron.after(FLASH_DURATION, hide_flash)
@@ -663,14 +743,12 @@ def hide_flash():
         cron.cancel(_flash_hide_job)
         _flash_hide_job = None
     if _flash_canvas:
-        _flash_canvas.unregister("draw", on_draw_flash)
-        _flash_canvas.close()
+        canvas_pool.release(_flash_canvas)
         _flash_canvas = None
 
 
 # ── Window capture highlight ─────────────────────────────────────────
 
-_highlight_canvas: Canvas = None
 _highlight_hide_job = None
 _highlight_window = None
 _highlight_name: str = ""
@@ -680,6 +758,28 @@ HIGHLIGHT_STROKE = 4
 HIGHLIGHT_LABEL_SIZE = 16
 HIGHLIGHT_LABEL_PAD_X = 10
 HIGHLIGHT_LABEL_PAD_Y = 6
+# Border band half-width (stroke is centered on the edge) and label tab clearance
+HIGHLIGHT_BAND = HIGHLIGHT_STROKE / 2 + 2
+HIGHLIGHT_TAB_HEIGHT = HIGHLIGHT_LABEL_SIZE + HIGHLIGHT_LABEL_PAD_Y * 2 + 4
+
+
+def _measure_label(text: str, textsize: float) -> Rect:
+    """Measure label text outside a draw callback, to size the strips for it."""
+    paint = skia.Paint()
+    paint.textsize = textsize
+    return paint.measure_text(text)[1]
+
+
+def _highlight_pill_rect(r: Rect, text_w: float, text_h: float) -> Rect:
+    """Label pill centered above the window, or just inside its top edge when
+    above would leave the window's own screen."""
+    pill_w = text_w + HIGHLIGHT_LABEL_PAD_X * 2
+    pill_h = text_h + HIGHLIGHT_LABEL_PAD_Y * 2
+    pill_x = r.x + r.width / 2 - pill_w / 2
+    pill_y = r.y - pill_h - 2
+    if pill_y < screen_for_rect(r).rect.y:
+        pill_y = r.y + 4
+    return Rect(pill_x, pill_y, pill_w, pill_h)
 
 
 def on_draw_highlight(c: SkiaCanvas):
@@ -706,23 +806,15 @@ def on_draw_highlight(c: SkiaCanvas):
         text_w = text_rect.width
         text_h = text_rect.height
 
-        pill_w = text_w + HIGHLIGHT_LABEL_PAD_X * 2
-        pill_h = text_h + HIGHLIGHT_LABEL_PAD_Y * 2
-        pill_x = r.x + r.width / 2 - pill_w / 2
-        pill_y = r.y - pill_h - 2
-
-        # Clamp above screen top
-        if pill_y < 0:
-            pill_y = r.y + 4
+        pill_rect = _highlight_pill_rect(r, text_w, text_h)
 
         # Background
         c.paint.color = HIGHLIGHT_COLOR
-        pill_rect = Rect(pill_x, pill_y, pill_w, pill_h)
         draw_rounded_rect(c, pill_rect, 6)
 
         # Text
         c.paint.color = "ffffffff"
-        c.draw_text(_highlight_name, pill_x + HIGHLIGHT_LABEL_PAD_X, pill_y + HIGHLIGHT_LABEL_PAD_Y + text_h)
+        c.draw_text(_highlight_name, pill_rect.x + HIGHLIGHT_LABEL_PAD_X, pill_rect.y + HIGHLIGHT_LABEL_PAD_Y + text_h)
 
 
 _highlight_show_job = None
@@ -749,42 +841,54 @@ def highlight_window(window, name: str):
 
 
 def _show_highlight():
-    """Create and freeze the highlight canvas."""
-    global _highlight_canvas, _highlight_hide_job, _highlight_show_job
+    """Place the highlight border band around the window and freeze it."""
+    global _highlight_hide_job, _highlight_show_job
     _highlight_show_job = None
 
-    if _highlight_canvas:
-        _highlight_canvas.unregister("draw", on_draw_highlight)
-        _highlight_canvas.close()
-        _highlight_canvas = None
+    try:
+        r = _highlight_window.rect
+    except Exception:
+        _highlight_band.close()
+        return
+    if r.width <= 0 or r.height <= 0:
+        _highlight_band.close()
+        return
 
-    screen: Screen = ui.main_screen()
-    _highlight_canvas = Canvas.from_screen(screen)
-    _highlight_canvas.register("draw", on_draw_highlight)
-    _highlight_canvas.freeze()
+    # The label sits above the window unless that would leave the screen,
+    # in which case on_draw_highlight tucks it just inside the top edge. The
+    # top strip also widens to the pill, which can be wider than the window.
+    tab_rect = None
+    if _highlight_name:
+        text_rect = _measure_label(_highlight_name, HIGHLIGHT_LABEL_SIZE)
+        tab_rect = _highlight_pill_rect(r, text_rect.width, text_rect.height)
+    if r.y - HIGHLIGHT_TAB_HEIGHT < screen_for_rect(r).rect.y:
+        _highlight_band.place(r, HIGHLIGHT_BAND, tab_below=HIGHLIGHT_TAB_HEIGHT + 4, tab_rect=tab_rect)
+    else:
+        _highlight_band.place(r, HIGHLIGHT_BAND, tab_above=HIGHLIGHT_TAB_HEIGHT, tab_rect=tab_rect)
 
     _highlight_hide_job = cron.after(HIGHLIGHT_DURATION, hide_highlight)
 
 
 def hide_highlight():
     """Hide the window highlight."""
-    global _highlight_canvas, _highlight_hide_job
+    global _highlight_hide_job
     if _highlight_hide_job:
         cron.cancel(_highlight_hide_job)
         _highlight_hide_job = None
-    if _highlight_canvas:
-        _highlight_canvas.unregister("draw", on_draw_highlight)
-        _highlight_canvas.close()
-        _highlight_canvas = None
+    _highlight_band.close()
+
+
+_highlight_band = BorderBand(on_draw=on_draw_highlight, pool=canvas_pool, name="highlight")
 
 
 # ── Persistent window highlight ──────────────────────────────────────
 
-_persistent_canvas: Canvas = None
 _persistent_window = None
 _persistent_name: str = ""
 _persistent_last_rect = None
 _persistent_poll_job = None
+_persistent_poll_delay_ms: int = 0
+_persistent_events_registered: bool = False
 
 PERSISTENT_COLOR = "6a6aff"
 PERSISTENT_ALPHA = "88"
@@ -792,7 +896,19 @@ PERSISTENT_STROKE = 2
 PERSISTENT_LABEL_SIZE = 13
 PERSISTENT_LABEL_PAD_X = 8
 PERSISTENT_LABEL_PAD_Y = 4
-PERSISTENT_POLL_INTERVAL = "200ms"
+PERSISTENT_BAND = PERSISTENT_STROKE / 2 + 2
+PERSISTENT_TAB_HEIGHT = PERSISTENT_LABEL_SIZE + PERSISTENT_LABEL_PAD_Y * 2 + 4
+# Fallback geometry poll: starts fast after any move/resize event and doubles
+# each idle tick, so a still desktop settles to one cheap check every few seconds.
+PERSISTENT_POLL_MIN_MS = 100
+PERSISTENT_POLL_MAX_MS = 3200
+
+
+def _persistent_tab_rect(r: Rect, text_w: float, text_h: float) -> Rect:
+    """Label tab centered 1/4 from the window's left, bottom flush with its top edge."""
+    pill_w = text_w + PERSISTENT_LABEL_PAD_X * 2
+    pill_h = text_h + PERSISTENT_LABEL_PAD_Y * 2
+    return Rect(r.x + r.width / 4 - pill_w / 2, r.y - pill_h, pill_w, pill_h)
 
 
 def on_draw_persistent(c: SkiaCanvas):
@@ -820,10 +936,9 @@ def on_draw_persistent(c: SkiaCanvas):
         text_w = text_rect.width
         text_h = text_rect.height
 
-        pill_w = text_w + PERSISTENT_LABEL_PAD_X * 2
-        pill_h = text_h + PERSISTENT_LABEL_PAD_Y * 2
-        pill_x = r.x + r.width / 4 - pill_w / 2
-        pill_y = r.y - pill_h  # above the window, bottom flush with top edge
+        tab_rect = _persistent_tab_rect(r, text_w, text_h)
+        pill_x, pill_y = tab_rect.x, tab_rect.y
+        pill_w, pill_h = tab_rect.width, tab_rect.height
 
         # Background — rounded top, straight bottom
         c.paint.color = PERSISTENT_COLOR + "ff"
@@ -849,25 +964,91 @@ def on_draw_persistent(c: SkiaCanvas):
         c.draw_text(display_name, pill_x + PERSISTENT_LABEL_PAD_X, pill_y + PERSISTENT_LABEL_PAD_Y + text_h)
 
 
-def _persistent_check_geometry():
-    """Cron interval callback: re-freeze canvas if the tracked window moved/resized."""
+def _persistent_check_geometry() -> bool:
+    """Move the border band if the tracked window moved/resized. Returns True on change."""
     global _persistent_last_rect
-    if not _persistent_window or not _persistent_canvas:
-        return
+    if not _persistent_window or not _persistent_band.is_showing:
+        return False
     try:
         r = _persistent_window.rect
     except Exception:
-        return
+        return False
     current = (r.x, r.y, r.width, r.height)
     if current != _persistent_last_rect:
         _persistent_last_rect = current
-        _persistent_canvas.freeze()
+        _place_persistent_band(r)
+        return True
+    return False
+
+
+def _place_persistent_band(r: Rect):
+    """Fit the persistent border strips (plus label tab) to the window rect."""
+    if r.width <= 0 or r.height <= 0:
+        return
+    tab_rect = None
+    if _persistent_name:
+        text_rect = _measure_label(_persistent_name.title(), PERSISTENT_LABEL_SIZE)
+        tab_rect = _persistent_tab_rect(r, text_rect.width, text_rect.height)
+    _persistent_band.place(
+        r, PERSISTENT_BAND, tab_above=PERSISTENT_TAB_HEIGHT, tab_rect=tab_rect
+    )
+
+
+def _schedule_persistent_poll(delay_ms: int):
+    """(Re)arm the fallback geometry poll to fire after delay_ms."""
+    global _persistent_poll_job, _persistent_poll_delay_ms
+    if _persistent_poll_job:
+        cron.cancel(_persistent_poll_job)
+    _persistent_poll_delay_ms = delay_ms
+    _persistent_poll_job = cron.after(f"{delay_ms}ms", _persistent_poll_tick)
+
+
+def _persistent_poll_tick():
+    """Fallback poll for WMs that don't report every move: back off while idle."""
+    global _persistent_poll_job
+    _persistent_poll_job = None
+    overlay_stats.tick("persistent_poll")
+    if not _persistent_window or not _persistent_band.is_showing:
+        # Nothing tracked — stop until show_persistent_highlight re-arms us
+        return
+    if _persistent_check_geometry():
+        delay = PERSISTENT_POLL_MIN_MS
+    else:
+        delay = min(_persistent_poll_delay_ms * 2, PERSISTENT_POLL_MAX_MS)
+    _schedule_persistent_poll(delay)
+
+
+def _on_persistent_window_event(window: ui.Window):
+    """win_move / win_resize handler: track the border immediately on drags."""
+    if _persistent_window is None or window != _persistent_window:
+        return
+    overlay_stats.tick("persistent_event")
+    _persistent_check_geometry()
+    # Movement is in progress — poll fast again to catch the settled rect
+    _schedule_persistent_poll(PERSISTENT_POLL_MIN_MS)
+
+
+def _register_persistent_events():
+    global _persistent_events_registered
+    if _persistent_events_registered:
+        return
+    ui.register("win_move", _on_persistent_window_event)
+    ui.register("win_resize", _on_persistent_window_event)
+    _persistent_events_registered = True
+
+
+def _unregister_persistent_events():
+    global _persistent_events_registered
+    if not _persistent_events_registered:
+        return
+    ui.unregister("win_move", _on_persistent_window_event)
+    ui.unregister("win_resize", _on_persistent_window_event)
+    _persistent_events_registered = False
 
 
 def show_persistent_highlight(window, name: str):
     """Update the persistent highlight to track the given window."""
-    global _persistent_canvas, _persistent_window, _persistent_name
-    global _persistent_last_rect, _persistent_poll_job
+    global _persistent_window, _persistent_name, _persistent_last_rect
 
     _persistent_window = window
     _persistent_name = name
@@ -877,55 +1058,58 @@ def show_persistent_highlight(window, name: str):
         _persistent_last_rect = (r.x, r.y, r.width, r.height)
     except Exception:
         _persistent_last_rect = None
+        return
 
-    # Create canvas if needed
-    if not _persistent_canvas:
-        screen = ui.main_screen()
-        _persistent_canvas = Canvas.from_screen(screen)
-        _persistent_canvas.register("draw", on_draw_persistent)
-
-    _persistent_canvas.freeze()
+    # Create the border strips if needed, or move them to this window
+    _place_persistent_band(r)
 
-    # Start geometry polling if not already running
-    if not _persistent_poll_job:
-        _persistent_poll_job = cron.interval(PERSISTENT_POLL_INTERVAL, _persistent_check_geometry)
+    # Follow move/resize events, with a backed-off poll as a safety net
+    _register_persistent_events()
+    _schedule_persistent_poll(PERSISTENT_POLL_MIN_MS)
 
 
 def hide_persistent_highlight():
-    """Destroy the persistent canvas and stop polling entirely (feature toggled off)."""
-    global _persistent_canvas, _persistent_window, _persistent_name
+    """Destroy the persistent border and stop tracking entirely (feature toggled off)."""
+    global _persistent_window, _persistent_name
     global _persistent_last_rect, _persistent_poll_job
 
+    _unregister_persistent_events()
     if _persistent_poll_job:
         cron.cancel(_persistent_poll_job)
         _persistent_poll_job = None
-    if _persistent_canvas:
-        _persistent_canvas.unregister("draw", on_draw_persistent)
-        _persistent_canvas.close()
-        _persistent_canvas = None
+    _persistent_band.close()
     _persistent_window = None
     _persistent_name = ""
     _persistent_last_rect = None
 
 
 def clear_persistent_highlight():
-    """Clear the tracked window but keep the canvas alive (non-recall window focused)."""
+    """Clear the tracked window but keep the strips alive (non-recall window focused)."""
     global _persistent_window, _persistent_name, _persistent_last_rect
+    global _persistent_poll_job
     _persistent_window = None
     _persistent_name = ""
     _persistent_last_rect = None
-    if _persistent_canvas:
-        _persistent_canvas.freeze()
+    if _persistent_poll_job:
+        cron.cancel(_persistent_poll_job)
+        _persistent_poll_job = None
+    _persistent_band.freeze()
 
 
 def rebuild_persistent_canvas():
-    """Rebuild the persistent canvas on a new screen (e.g. monitor change)."""
-    global _persistent_canvas
-    if not _persistent_canvas:
+    """Rebuild the persistent border strips after a monitor change."""
+    global _persistent_last_rect
+    if not _persistent_band.is_showing:
+        return
+    _persistent_band.close()
+    if not _persistent_window:
         return
-    _persistent_canvas.unregister("draw", on_draw_persistent)
-    _persistent_canvas.close()
-    screen = ui.main_screen()
-    _persistent_canvas = Canvas.from_screen(screen)
-    _persistent_canvas.register("draw", on_draw_persistent)
-    _persistent_canvas.freeze()
+    try:
+        r = _persistent_window.rect
+    except Exception:
+        return
+    _persistent_last_rect = (r.x, r.y, r.width, r.height)
+    _place_persistent_band(r)
+
+
+_persistent_band = BorderBand(on_draw=on_draw_persistent, name="persistent")
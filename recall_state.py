@@ -114,27 +114,33 @@ def save_to_disk():
         print(f"[recall] Error saving to disk: {e}")
 
 
+# Last map assigned to saved_window_names; reassigning recompiles the grammar
+_published_window_names: dict[str, str] | None = None
+
+
 def update_window_list():
     """Update the dynamic list of saved window names for voice commands.
-    Uses create_spoken_forms_from_map so aliases resolve to the canonical name."""
-    if saved_windows:
-        # Build map: {spoken_form: canonical_name}
-        # Both the canonical name and all aliases point to the canonical name
-        name_map = {}
-        for name, info in saved_windows.items():
-            name_map[name] = name
-        # Add aliases second, but never let an alias shadow a canonical name
-        for name, info in saved_windows.items():
-            for alias in info.get("aliases", []):
-                if alias not in name_map:
-                    name_map[alias] = name
-        spoken_forms = actions.user.create_spoken_forms_from_map(
-            name_map,
-            generate_subsequences=False,
-        )
+    Uses create_spoken_forms_from_map so aliases resolve to the canonical name.
+    Spoken forms are memoized there, and the list is left alone if unchanged."""
+    global _published_window_names
+    # Build map: {spoken_form: canonical_name}
+    # Both the canonical name and all aliases point to the canonical name
+    name_map = {}
+    for name, info in saved_windows.items():
+        name_map[name] = name
+    # Add aliases second, but never let an alias shadow a canonical name
+    for name, info in saved_windows.items():
+        for alias in info.get("aliases", []):
+            if alias not in name_map:
+                name_map[alias] = name
+    spoken_forms = actions.user.create_spoken_forms_from_map(
+        name_map,
+        generate_subsequences=False,
+    )
+
+    if spoken_forms != _published_window_names:
         ctx.lists["self.saved_window_names"] = spoken_forms
-    else:
-        ctx.lists["self.saved_window_names"] = {}
+        _published_window_names = spoken_forms
 
 
 def _cancel_pending():
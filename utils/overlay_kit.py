@@ -3,9 +3,15 @@
 Each overlay keeps its own color constants and passes them in as arguments.
 DismissibleOverlay provides shared lifecycle: click-outside-dismiss,
 escape key, X close hint, auto-hide timer.
+BorderBand covers only the edges of a window rect for border-style overlays.
+CanvasPool keeps short-lived overlay canvases alive (hidden) between uses.
+screen_for_rect / active_screen route overlays to the monitor that owns them.
+overlay_stats records draw times, freeze rates and live canvas counts.
 """
 
-from typing import Callable, Optional
+import time
+from collections import deque
+from typing import Callable, Hashable, Optional
 from talon import Context, Module, cron, skia, ui
 from talon.canvas import Canvas, MouseEvent
 from talon.screen import Screen
@@ -21,6 +27,82 @@ _overlay_ctx = Context()
 _active_overlays: list = []
 
 
+class OverlayStats:
+    """Bounded in-memory instrumentation for overlay canvases, keyed by name.
+
+    Per name it keeps the last SAMPLES draw durations and timestamps, the last
+    SAMPLES tick timestamps (e.g. geometry polls), and counts of canvases
+    opened/alive. Every canvas here is frozen, so one draw == one freeze and
+    draws/second is the freeze rate. Dump with "recall overlay stats".
+    """
+
+    SAMPLES = 240
+    RATE_WINDOW = 10.0  # seconds used for the per-second rates
+
+    def __init__(self):
+        self._draw_ms: dict[str, deque] = {}
+        self._draw_at: dict[str, deque] = {}
+        self._tick_at: dict[str, deque] = {}
+        self._opened: dict[str, int] = {}
+        self._alive: dict[str, int] = {}
+
+    def _samples(self, store: dict, name: str) -> deque:
+        if name not in store:
+            store[name] = deque(maxlen=self.SAMPLES)
+        return store[name]
+
+    def timed(self, name: str, on_draw: Callable) -> Callable:
+        """Wrap a draw callback so each call records its duration."""
+        def draw(*args):
+            start = time.perf_counter()
+            try:
+                return on_draw(*args)
+            finally:
+                end = time.perf_counter()
+                self._samples(self._draw_ms, name).append((end - start) * 1000)
+                self._samples(self._draw_at, name).append(end)
+        return draw
+
+    def tick(self, name: str):
+        """Record a non-draw event, e.g. a geometry poll."""
+        self._samples(self._tick_at, name).append(time.perf_counter())
+
+    def opened(self, name: str):
+        self._opened[name] = self._opened.get(name, 0) + 1
+        self._alive[name] = self._alive.get(name, 0) + 1
+
+    def closed(self, name: str):
+        self._alive[name] = max(self._alive.get(name, 0) - 1, 0)
+
+    def _rate(self, stamps: Optional[deque]) -> float:
+        if not stamps:
+            return 0.0
+        cutoff = time.perf_counter() - self.RATE_WINDOW
+        return sum(1 for t in stamps if t >= cutoff) / self.RATE_WINDOW
+
+    def report(self) -> list[str]:
+        """One summary line per overlay name, plus a total of live canvases."""
+        names = sorted(set(self._draw_ms) | set(self._tick_at) | set(self._opened))
+        lines = [f"overlay canvases alive: {sum(self._alive.values())}"]
+        for name in names:
+            durations = sorted(self._draw_ms.get(name, ()))
+            line = f"  {name}: alive={self._alive.get(name, 0)} opened={self._opened.get(name, 0)}"
+            if durations:
+                avg = sum(durations) / len(durations)
+                p95 = durations[min(int(len(durations) * 0.95), len(durations) - 1)]
+                line += (
+                    f" draw avg={avg:.2f}ms p95={p95:.2f}ms max={durations[-1]:.2f}ms"
+                    f" freezes/s={self._rate(self._draw_at.get(name)):.1f}"
+                )
+            if name in self._tick_at:
+                line += f" ticks/s={self._rate(self._tick_at[name]):.1f}"
+            lines.append(line)
+        return lines
+
+
+overlay_stats = OverlayStats()
+
+
 def draw_rounded_rect(c: SkiaCanvas, rect: Rect, radius: float):
     """Draw a rounded rectangle using a Skia path."""
     r = min(radius, rect.width / 2, rect.height / 2)
@@ -90,6 +172,259 @@ def draw_separator(c: SkiaCanvas, x1: float, x2: float, y: float, color: str):
     c.paint.style = c.paint.Style.FILL
 
 
+def screen_for_rect(rect: Rect) -> Screen:
+    """Return the screen showing the largest part of rect (main screen if none)."""
+    best, best_area = None, 0
+    for screen in ui.screens():
+        sr = screen.rect
+        w = min(rect.x + rect.width, sr.x + sr.width) - max(rect.x, sr.x)
+        h = min(rect.y + rect.height, sr.y + sr.height) - max(rect.y, sr.y)
+        if w > 0 and h > 0 and w * h > best_area:
+            best, best_area = screen, w * h
+    return best or ui.main_screen()
+
+
+def active_screen() -> Screen:
+    """Return the screen holding the focused window, falling back to the main screen."""
+    try:
+        return screen_for_rect(ui.active_window().rect)
+    except Exception:
+        return ui.main_screen()
+
+
+def screen_key(screen: Screen) -> tuple:
+    """Hashable identity for a screen, based on its geometry."""
+    r = screen.rect
+    return (r.x, r.y, r.width, r.height)
+
+
+class CanvasPool:
+    """Reusable canvases for overlays that are shown and hidden constantly.
+
+    Creating and closing a canvas per flash/label is comparatively expensive,
+    so released canvases are hidden and kept for the next acquire of the same
+    slot. Screen-sized canvases are pooled per screen; rect canvases (see
+    BorderBand) are moved to the requested rect on reuse. Draw callbacks are
+    unregistered on release and registered again on acquire.
+
+    All pooled canvases are dropped on screen_change, since their backing
+    geometry may no longer match any monitor. Canvases in use at that moment
+    are closed when released instead of being pooled.
+
+    Usage:
+        c = canvas_pool.acquire("flash", on_draw_flash, screen=screen)
+        c.freeze()
+        ...
+        canvas_pool.release(c)
+    """
+
+    def __init__(self):
+        self._idle: dict[Hashable, Canvas] = {}
+        # slot -> (canvas, on_draw, registered callback) for canvases handed out
+        self._busy: dict[Hashable, tuple[Canvas, Callable, Callable]] = {}
+        self._stale: set[Hashable] = set()
+        self._watching = False
+
+    def acquire(
+        self,
+        name: str,
+        on_draw: Callable,
+        screen: Optional[Screen] = None,
+        rect: Optional[Rect] = None,
+    ) -> Canvas:
+        """Return a visible canvas for the slot, reusing a pooled one if possible.
+
+        Pass rect for a canvas covering just that rect, otherwise the canvas
+        covers screen (default: main screen). Acquiring a slot that is already
+        in use returns the same canvas with on_draw swapped in.
+        """
+        self._watch_screens()
+        if rect is None:
+            screen = screen or ui.main_screen()
+            slot = (name, screen_key(screen))
+        else:
+            slot = (name,)
+
+        if slot in self._stale:
+            # Still showing from before a screen change: replace it outright
+            stale_canvas, _, registered = self._busy.pop(slot)
+            stale_canvas.unregister("draw", registered)
+            self._close(slot, stale_canvas)
+            self._stale.discard(slot)
+
+        if slot in self._busy:
+            canvas, old_draw, registered = self._busy[slot]
+            if old_draw is not on_draw:
+                canvas.unregister("draw", registered)
+                registered = overlay_stats.timed(self._stats_name(slot), on_draw)
+                canvas.register("draw", registered)
+        else:
+            canvas = self._idle.pop(slot, None)
+            if canvas is None:
+                canvas = Canvas.from_rect(rect) if rect is not None else Canvas.from_screen(screen)
+                overlay_stats.opened(self._stats_name(slot))
+            else:
+                canvas.show()
+            registered = overlay_stats.timed(self._stats_name(slot), on_draw)
+            canvas.register("draw", registered)
+        if rect is not None:
+            canvas.rect = rect
+        self._busy[slot] = (canvas, on_draw, registered)
+        return canvas
+
+    def release(self, canvas: Canvas):
+        """Unregister the draw callback and hide the canvas until its next acquire."""
+        for slot, (busy_canvas, _, registered) in self._busy.items():
+            if busy_canvas is canvas:
+                break
+        else:
+            return
+        del self._busy[slot]
+        canvas.unregister("draw", registered)
+        if slot in self._stale:
+            self._stale.discard(slot)
+            self._close(slot, canvas)
+            return
+        canvas.hide()
+        self._idle[slot] = canvas
+
+    def rebuild(self):
+        """Drop every idle canvas; in-use ones are closed on release."""
+        for slot, canvas in self._idle.items():
+            self._close(slot, canvas)
+        self._idle.clear()
+        self._stale.update(self._busy.keys())
+
+    @staticmethod
+    def _stats_name(slot: tuple) -> str:
+        # "highlight:2" -> "highlight", so a band's strips report together
+        return slot[0].split(":")[0]
+
+    def _close(self, slot: tuple, canvas: Canvas):
+        canvas.close()
+        overlay_stats.closed(self._stats_name(slot))
+
+    def _watch_screens(self):
+        if not self._watching:
+            ui.register("screen_change", lambda _: self.rebuild())
+            self._watching = True
+
+
+canvas_pool = CanvasPool()
+
+
+class BorderBand:
+    """Four edge-strip canvases covering just the border band around a rect.
+
+    Border overlays only paint a stroke and a small label tab, so a full-screen
+    canvas wastes compositing on pixels that are never touched. BorderBand
+    places thin canvases over the top, bottom, left and right edges instead.
+    The top strip can be extended above/below the edge to fit a label tab, and
+    widened to a tab_rect so labels wider than the window aren't clipped.
+
+    The same draw callback is registered on every strip. Drawing uses screen
+    coordinates, so the callback draws the whole border and each strip keeps
+    only the part that falls inside it.
+
+    Pass a pool (and a slot name) for short-lived bands so their strips are
+    reused between shows rather than recreated.
+
+    Usage:
+        band = BorderBand(on_draw=my_draw_fn)
+        band.place(window.rect, band=4, tab_above=24)  # creates or moves strips
+        band.close()
+    """
+
+    def __init__(
+        self,
+        on_draw: Callable,
+        pool: Optional[CanvasPool] = None,
+        name: str = "border_band",
+    ):
+        self._on_draw = on_draw
+        self._timed_draw = overlay_stats.timed(name, on_draw)
+        self._pool = pool
+        self._name = name
+        self._canvases: list[Canvas] = []
+
+    @property
+    def is_showing(self) -> bool:
+        return bool(self._canvases)
+
+    @staticmethod
+    def strip_rects(
+        rect: Rect,
+        band: float,
+        tab_above: float = 0,
+        tab_below: float = 0,
+        tab_rect: Optional[Rect] = None,
+    ) -> list[Rect]:
+        """Return the top, bottom, left and right strip rects for a border band.
+
+        tab_rect is the label tab in screen coordinates; the top strip grows to
+        cover it, since a label can be wider than the window or sit off its edge.
+        """
+        x, y, w, h = rect.x, rect.y, rect.width, rect.height
+        side_top = y + band + tab_below
+        side_h = max(h - band * 2 - tab_below, 1)
+        top = Rect(x - band, y - band - tab_above, w + band * 2, band * 2 + tab_above + tab_below)
+        if tab_rect is not None:
+            # One pixel of slack for the antialiased edge of the tab
+            left = min(top.x, tab_rect.x - 1)
+            right = max(top.x + top.width, tab_rect.x + tab_rect.width + 1)
+            upper = min(top.y, tab_rect.y - 1)
+            lower = max(top.y + top.height, tab_rect.y + tab_rect.height + 1)
+            top = Rect(left, upper, right - left, lower - upper)
+        return [
+            top,
+            Rect(x - band, y + h - band, w + band * 2, band * 2),
+            Rect(x - band, side_top, band * 2, side_h),
+            Rect(x + w - band, side_top, band * 2, side_h),
+        ]
+
+    def place(
+        self,
+        rect: Rect,
+        band: float,
+        tab_above: float = 0,
+        tab_below: float = 0,
+        tab_rect: Optional[Rect] = None,
+    ):
+        """Create the strips (first call) or move/resize them to a new rect, then redraw."""
+        strips = self.strip_rects(rect, band, tab_above, tab_below, tab_rect)
+        if self._pool is not None:
+            self._canvases = [
+                self._pool.acquire(f"{self._name}:{i}", self._on_draw, rect=strip)
+                for i, strip in enumerate(strips)
+            ]
+        elif not self._canvases:
+            for strip in strips:
+                canvas = Canvas.from_rect(strip)
+                canvas.register("draw", self._timed_draw)
+                self._canvases.append(canvas)
+                overlay_stats.opened(self._name)
+        else:
+            for canvas, strip in zip(self._canvases, strips):
+                canvas.rect = strip
+        self.freeze()
+
+    def freeze(self):
+        """Re-freeze every strip to trigger a redraw."""
+        for canvas in self._canvases:
+            canvas.freeze()
+
+    def close(self):
+        """Unregister and destroy all strips (or hand them back to the pool)."""
+        for canvas in self._canvases:
+            if self._pool is not None:
+                self._pool.release(canvas)
+            else:
+                canvas.unregister("draw", self._timed_draw)
+                canvas.close()
+                overlay_stats.closed(self._name)
+        self._canvases = []
+
+
 def _update_overlay_tag():
     """Set or clear the shared overlay_visible tag."""
     if _active_overlays:
@@ -106,6 +441,9 @@ class DismissibleOverlay:
         overlay.show()   # creates canvas, registers mouse, sets tag
         overlay.hide()   # tears down everything
 
+    show() takes an optional screen (default: the focused window's screen);
+    on_draw should lay out against overlay.screen.rect.
+
     The on_draw callback receives (canvas, panel_rect_setter) where
     panel_rect_setter is a callable to report the panel rect for
     click-outside detection: panel_rect_setter(Rect(...))
@@ -120,8 +458,11 @@ class DismissibleOverlay:
         close_hint_color: str = "aaaaaaff",
         on_hide: Optional[Callable] = None,
         blocks_mouse: bool = True,
+        name: str = "overlay",
     ):
         self._user_on_draw = on_draw
+        self._name = name
+        self._timed_draw = overlay_stats.timed(name, self._on_draw)
         self._auto_hide = auto_hide
         self._close_hint_text = close_hint_text
         self._close_hint_size = close_hint_size
@@ -129,6 +470,7 @@ class DismissibleOverlay:
         self._on_hide = on_hide
         self._blocks_mouse = blocks_mouse
         self._canvas: Canvas = None
+        self._screen: Screen = None
         self._hide_job = None
         self._panel_rect: Rect = None
         self._panel_rects: list[Rect] = []
@@ -137,6 +479,11 @@ class DismissibleOverlay:
     def is_showing(self) -> bool:
         return self._canvas is not None
 
+    @property
+    def screen(self) -> Screen:
+        """The screen the overlay is (or was last) shown on."""
+        return self._screen or ui.main_screen()
+
     def set_panel_rect(self, rect: Rect):
         """Call from on_draw to set the panel rect for click-outside detection."""
         self._panel_rect = rect
@@ -171,17 +518,18 @@ class DismissibleOverlay:
             elif self._panel_rect and not self._panel_rect.contains(e.gpos):
                 self.hide()
 
-    def show(self):
+    def show(self, screen: Optional[Screen] = None):
         """Create canvas with mouse dismiss, escape tag, and optional auto-hide."""
         if self._canvas:
             self._teardown()
 
-        screen: Screen = ui.main_screen()
-        self._canvas = Canvas.from_screen(screen)
+        self._screen = screen or active_screen()
+        self._canvas = Canvas.from_screen(self._screen)
         self._canvas.blocks_mouse = self._blocks_mouse
-        self._canvas.register("draw", self._on_draw)
+        self._canvas.register("draw", self._timed_draw)
         self._canvas.register("mouse", self._on_mouse)
         self._canvas.freeze()
+        overlay_stats.opened(self._name)
 
         _active_overlays.append(self)
         _update_overlay_tag()
@@ -195,10 +543,11 @@ class DismissibleOverlay:
             cron.cancel(self._hide_job)
             self._hide_job = None
         if self._canvas:
-            self._canvas.unregister("draw", self._on_draw)
+            self._canvas.unregister("draw", self._timed_draw)
             self._canvas.unregister("mouse", self._on_mouse)
             self._canvas.close()
             self._canvas = None
+            overlay_stats.closed(self._name)
         self._panel_rect = None
         self._panel_rects = []
         if self in _active_overlays:
@@ -212,10 +561,11 @@ class DismissibleOverlay:
             cron.cancel(self._hide_job)
             self._hide_job = None
         if self._canvas:
-            self._canvas.unregister("draw", self._on_draw)
+            self._canvas.unregister("draw", self._timed_draw)
             self._canvas.unregister("mouse", self._on_mouse)
             self._canvas.close()
             self._canvas = None
+            overlay_stats.closed(self._name)
         self._panel_rect = None
         self._panel_rects = []
         if self in _active_overlays:
@@ -231,3 +581,8 @@ class Actions:
         """Dismiss the topmost active overlay (shared escape handler)"""
         if _active_overlays:
             _active_overlays[-1].hide()
+
+    def overlay_stats_dump():
+        """Print overlay draw timings, freeze rates and live canvas counts to the log"""
+        for line in overlay_stats.report():
+            print(f"[overlay] {line}")